@@ -0,0 +1,108 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, TypeVar
+
+import pygame
+from pygame.surface import Surface, SurfaceType
+
+from models.fonts_name import FontsName
+
+FONT_PATH: str = "resources/FreeSansBold.otf"
+FONT_SIZES: Dict[FontsName, int] = {
+    FontsName.GUESSED_LETTER: 50,
+    FontsName.INDICATOR: 25,
+    FontsName.PLAY_AGAIN: 40,
+    FontsName.CHOOSE_MODE: 15,
+    FontsName.MESSAGE_BOX: 18
+}
+
+Asset = TypeVar("Asset")
+
+
+class Assets:
+    """
+    Class responsible for loading fonts, images and sounds the first time they are used, and sharing them afterwards.
+    The font module and the mixer are initialized only when they are needed, so code which never draws or plays
+    anything does not pay for them.
+    """
+    _fonts: Dict[FontsName, pygame.font.Font] = {}
+    _images: Dict[str, Surface | SurfaceType] = {}
+    _textures: Dict[str, Surface | SurfaceType] = {}
+    _images_lock: threading.Lock = threading.Lock()  # Images can also be loaded by the prefetching thread.
+    _sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
+    # Time spent loading every asset, in milliseconds.
+    load_times: Dict[str, float] = {}
+
+    @classmethod
+    def get_font(cls, name: FontsName) -> pygame.font.Font:
+        if name not in cls._fonts:
+            if not pygame.font.get_init():
+                cls._timed("font module", pygame.font.init)
+            cls._fonts[name] = cls._timed(f"font {name.value}", lambda: pygame.font.Font(FONT_PATH, FONT_SIZES[name]))
+        return cls._fonts[name]
+
+    @classmethod
+    def get_image(cls, path: str) -> Surface | SurfaceType:
+        with cls._images_lock:
+            if path not in cls._images:
+                cls._images[path] = cls._timed(path, lambda: pygame.image.load(path))
+            return cls._images[path]
+
+    @classmethod
+    def get_texture(cls, path: str) -> Surface | SurfaceType:
+        """
+        Returns the image converted to the pixel format of the screen, so blitting it does not convert every pixel again.
+        Requires the window to be open.
+        """
+        if path not in cls._textures:
+            image: Surface | SurfaceType = cls.get_image(path)
+            has_alpha: bool = bool(image.get_flags() & pygame.SRCALPHA)
+            cls._textures[path] = cls._timed(f"texture {path}", image.convert_alpha if has_alpha else image.convert)
+        return cls._textures[path]
+
+    @classmethod
+    def prefetch_images(cls, paths: List[str]) -> threading.Thread:
+        # Decoding happens on a background thread, only the conversion to the screen format is left for the first use.
+        def load_images() -> None:
+            for path in paths:
+                cls.get_image(path)
+
+        thread = threading.Thread(target=load_images, name="image-prefetch", daemon=True)
+        thread.start()
+        return thread
+
+    @classmethod
+    def get_sound(cls, path: str) -> Optional[pygame.mixer.Sound]:
+        # Without an audio device the game stays silent instead of failing.
+        if path not in cls._sounds:
+            cls._sounds[path] = cls._timed(path, lambda: pygame.mixer.Sound(path)) if cls._init_mixer() else None
+        return cls._sounds[path]
+
+    @classmethod
+    def play_sound(cls, path: str) -> None:
+        sound: Optional[pygame.mixer.Sound] = cls.get_sound(path)
+        if sound is not None:
+            sound.play()
+
+    @classmethod
+    def play_music(cls, path: str, volume: float) -> None:
+        if cls._init_mixer():
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.play(-1)
+            pygame.mixer.music.set_volume(volume)
+
+    @classmethod
+    def _init_mixer(cls) -> bool:
+        if not pygame.mixer.get_init():
+            try:
+                cls._timed("mixer", pygame.mixer.init)
+            except pygame.error:
+                return False
+        return True
+
+    @classmethod
+    def _timed(cls, name: str, load: Callable[[], Asset]) -> Asset:
+        start_time: float = time.perf_counter()
+        asset: Asset = load()
+        cls.load_times[name] = (time.perf_counter() - start_time) * 1000
+        return asset
@@ -17,6 +17,8 @@ class Button:
     :param bg_color: background color of the button
     :type bg_color: str
     """
+    __slots__ = ("x", "y", "text", "text_offset", "rect", "bg_color")
+
     def __init__(self, x: float, y: float, text: str, text_offset: Tuple[float, float], rect: Tuple[float, float, float, float], bg_color: str):
         self.x: float = x
         self.y: float = y
@@ -21,6 +21,8 @@ class ChooseModeButton(Button):
     :param color: color background of the button
     :type color: Color(str, Enum)
     """
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, mode: Difficulty, color: Color = Color.OUTLINE):
         text_offset: Tuple[float, float] = (x - len(mode) * 0.5 + 100/2, y + TEXT_Y_OFFSET)
         rect: Tuple[float, float, float, float] = (x, y, 100, BUTTON_HEIGHT)
@@ -24,6 +24,8 @@ class Indicator(Button):
     :param x: width of the indicator box
     :type x: float
     """
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, letter: str, theme: Theme, width: float = INDICATOR_WIDTH):
         text_offset: Tuple[float, float] = (x - len(letter) * 0.5 + width/2, y + TEXT_Y_OFFSET)
         rect: Tuple[float, float, float, float] = (x, y, width, INDICATOR_HEIGHT)
@@ -32,7 +34,6 @@ class Indicator(Button):
 
     def reset(self, theme):
         self.bg_color = Color.OUTLINE if theme == Theme.LIGHT else Color.OUTLINE_DARK
-        self.draw()
 
     def draw(self) -> None:
         Ui.draw_button(self, FontsName.INDICATOR)
@@ -20,6 +20,11 @@ class LetterBox:
     :param bg_position: box position in the window
     :type bg_position: Tuple[str, str]
     """
+    # Letters are created for every typed character, so they carry no per-instance dictionary.
+    __slots__ = ("bg_color", "text_color", "bg_x", "bg_y", "bg_rect", "bg_rect_copy", "character", "text_position",
+                 "flip_velocity", "shake_velocity", "shake_counter", "is_flip_playing", "is_shake_playing",
+                 "bg_color_scheduled", "text_color_scheduled", "target_y")
+
     def __init__(self, character: str, bg_position: Tuple[float, float], theme: Theme):
         # Initializes all the variables, including text, color, position, size, etc.
         self.bg_color: str = Color.WHITE if theme == Theme.LIGHT else Color.BLACK_BG
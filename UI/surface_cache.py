@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable
+
+from pygame.surface import Surface, SurfaceType
+
+
+class SurfaceCache:
+    """
+    Bounded cache of pre-rendered surfaces, which drops the least recently used surface once it is full.
+    Hits and misses are counted, so the size can be tuned.
+
+    :param max_size: maximum number of surfaces kept in the cache
+    :type max_size: int
+    """
+    hits: int
+    misses: int
+
+    def __init__(self, max_size: int):
+        self.max_size: int = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: OrderedDict[Hashable, Surface | SurfaceType] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def get(self, key: Hashable, render: Callable[[], Surface | SurfaceType]) -> Surface | SurfaceType:
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = render()
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def stats(self) -> Dict[str, int | float]:
+        lookups: int = self.hits + self.misses
+        return {
+            "size": len(self._surfaces),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
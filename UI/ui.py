@@ -1,32 +1,26 @@
-import threading
-import time
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 import pygame
 from pygame.rect import Rect, RectType
 from pygame.surface import Surface, SurfaceType
 
+from UI.assets import Assets
 from UI.button import Button
+from UI.surface_cache import SurfaceCache
 from constants import Constants
 from models.Theme import Theme
 from models.color import Color
 from models.fonts_name import FontsName
-
-# Initialize pygame before loading assets.
-pygame.init()
-
-# Images/sprites.
-ICON = pygame.image.load(Constants.ICON_PATH)
-
-# Fonts.
-GUESSED_LETTER_FONT = pygame.font.Font("resources/FreeSansBold.otf", 50)
-INDICATOR_LETTER_FONT = pygame.font.Font("resources/FreeSansBold.otf", 25)
-PLAY_AGAIN_FONT = pygame.font.Font("resources/FreeSansBold.otf", 40)
-CHOOSE_MODE_LETTER_FONT = pygame.font.Font("resources/FreeSansBold.otf", 15)
-MESSAGE_BOX_FONT = pygame.font.Font("resources/FreeSansBold.otf", 18)
+from utils.profiler import Profiler
 
 # Other constants.
 FONT_SCALE_FACTOR = 80
+GLYPH_HEIGHT_BUCKET = 2  # Scaled glyphs are cached with their height rounded to this many pixels.
+GLYPH_CACHE_SIZE = 512
+TILE_CACHE_SIZE = 256
+LETTERBOX_TEXT_OFFSET: Tuple[int, int] = (36, 34)  # Center of the letter relative to the top left corner of its box.
+PROFILER_OVERLAY_RECT: Tuple[int, int, int, int] = (5, 5, 310, 36)
+PROFILER_OVERLAY_LINE_HEIGHT: int = 18
 
 
 class Ui:
@@ -41,47 +35,115 @@ class Ui:
     _screen: Surface | SurfaceType
     _background: Surface | SurfaceType
     _background_rect: Rect | RectType | None
+    _dirty_rects: List[Rect | RectType] = []
+    _popup_rect: Rect | RectType | None = None  # Area covered by the popups shown since the last one was hidden.
+    glyph_cache: SurfaceCache = SurfaceCache(GLYPH_CACHE_SIZE)
+    tile_cache: SurfaceCache = SurfaceCache(TILE_CACHE_SIZE)
     theme: Theme
 
     @classmethod
     def __init__(cls, window_height: float, background_path: str, theme: Theme):
         cls.theme = theme
-        cls._background = pygame.image.load(background_path)
-        cls._background_rect = cls._background.get_rect(center=Constants.BG_GRID_CENTER)
+        pygame.display.init()
         cls._screen = pygame.display.set_mode((Constants.WIDTH, window_height))
+        cls.update_background(background_path)
         cls.reset_ui()
         pygame.display.set_caption(Constants.WINDOW_TITLE)
-        pygame.display.set_icon(ICON)
-        pygame.display.update()
+        pygame.display.set_icon(Assets.get_image(Constants.ICON_PATH))
+        cls.flush()
 
     @classmethod
     def update_background(cls, background_path: str) -> None:
-        cls._background = pygame.image.load(background_path)
+        cls._background = Assets.get_texture(background_path)
         cls._background_rect = cls._background.get_rect(center=Constants.BG_GRID_CENTER)
 
     @classmethod
+    @Profiler.timed("Ui.reset_ui")
     def reset_ui(cls) -> None:
         cls._screen.fill(Color.WHITE if cls.theme == Theme.LIGHT else Color.BLACK_BG)
         cls._screen.blit(cls._background, cls._background_rect)
+        cls.force_display_update()
+        cls._popup_rect = None
 
     @classmethod
     def force_display_update(cls) -> None:
-        pygame.display.update()
+        cls._mark_dirty(cls._screen.get_rect())
+
+    @classmethod
+    @Profiler.timed("display update")
+    def flush(cls) -> None:
+        dirty_rects, cls._dirty_rects = cls._dirty_rects, []
+        if not dirty_rects:
+            return
+        screen_rect: Rect | RectType = cls._screen.get_rect()
+        if any(rect.contains(screen_rect) for rect in dirty_rects):
+            pygame.display.update(screen_rect)
+        else:
+            pygame.display.update(dirty_rects)
+
+    @classmethod
+    def _mark_dirty(cls, rect: Tuple[float, float, float, float] | Rect | RectType) -> None:
+        cls._dirty_rects.append(Rect(rect))
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Dict[str, int | float]]:
+        return {"glyphs": cls.glyph_cache.stats(), "tiles": cls.tile_cache.stats()}
+
+    @classmethod
+    @Profiler.timed("font render")
+    def _render_text(cls, text: str, font: FontsName, color: str) -> Surface | SurfaceType:
+        return Assets.get_font(font).render(text, True, color)
+
+    @classmethod
+    def _get_glyph(cls, text: str, font: FontsName, color: str, height: float | None = None) -> Surface | SurfaceType:
+        # Without a height the glyph is returned in its natural size.
+        if height is None:
+            return cls.glyph_cache.get((text, font, color, None), lambda: cls._render_text(text, font, color))
+
+        height_bucket: int = round(abs(height) / GLYPH_HEIGHT_BUCKET)
+
+        def render_scaled() -> Surface | SurfaceType:
+            text_surface: Surface | SurfaceType = cls._get_glyph(text, font, color)
+            return pygame.transform.scale(text_surface, (text_surface.get_width(), height_bucket * GLYPH_HEIGHT_BUCKET))
+
+        return cls.glyph_cache.get((text, font, color, height_bucket), render_scaled)
+
+    @classmethod
+    def _get_letterbox_glyph(cls, character: str, color: str, box_height: float) -> Surface | SurfaceType:
+        # The letter is scaled together with its containing box.
+        text_height: int = cls._get_glyph(character, FontsName.GUESSED_LETTER, color).get_height()
+        return cls._get_glyph(character, FontsName.GUESSED_LETTER, color, text_height * (box_height / FONT_SCALE_FACTOR))
+
+    @classmethod
+    def _get_letterbox_tile(cls, character: str, bg_color: str, text_color: str) -> Surface | SurfaceType:
+        def render_tile() -> Surface | SurfaceType:
+            tile_rect: Tuple[float, float, float, float] = (0, 0, Constants.LETTERBOX_SIZE, Constants.LETTERBOX_SIZE)
+            tile: Surface | SurfaceType = Surface(tile_rect[2:]).convert()
+            tile.fill(bg_color)
+            if bg_color == Color.WHITE:
+                pygame.draw.rect(tile, Color.FILLED_OUTLINE, tile_rect, 3)
+            text_surface: Surface | SurfaceType = cls._get_letterbox_glyph(character, text_color, Constants.LETTERBOX_SIZE)
+            tile.blit(text_surface, text_surface.get_rect(center=LETTERBOX_TEXT_OFFSET))
+            return tile
+
+        return cls.tile_cache.get((character, bg_color, text_color, cls.theme), render_tile)
 
     @classmethod
+    @Profiler.timed("Ui.draw_button")
     def draw_button(cls, button: Button, font: FontsName) -> None:
-        fonts = {
-            FontsName.INDICATOR: INDICATOR_LETTER_FONT,
-            FontsName.CHOOSE_MODE: CHOOSE_MODE_LETTER_FONT
-        }
         pygame.draw.rect(cls._screen, button.bg_color, button.rect, border_radius=7)
-        text_surface = fonts[font].render(button.text, True, Color.WHITE)
+        text_surface = cls._get_glyph(button.text, font, Color.WHITE)
         text_rect = text_surface.get_rect(center=button.text_offset)
         cls._screen.blit(text_surface, text_rect)
-        pygame.display.update()
+        cls._mark_dirty(button.rect)
 
     @classmethod
+    @Profiler.timed("Ui.draw_letterbox_on_board")
     def draw_letterbox_on_board(cls, letterbox) -> None:
+        # The box may be squashed or moved by an animation, so its resting place is always refreshed as well.
+        dirty_rect: Rect | RectType = Rect(letterbox.bg_rect)
+        dirty_rect.normalize()
+        dirty_rect.union_ip(letterbox.bg_rect_copy)
         # If animating, draw a rectangle with bigger margins first to cover the background grid.
         if letterbox.is_flip_playing:
             bg_grid_cover = (letterbox.bg_rect_copy[0] - 2,
@@ -89,6 +151,14 @@ class Ui:
                              letterbox.bg_rect_copy[2] + 4,
                              letterbox.bg_rect_copy[3] + 4)
             pygame.draw.rect(cls._screen, Color.WHITE if cls.theme == Theme.LIGHT else Color.BLACK_BG, bg_grid_cover)
+            dirty_rect.union_ip(bg_grid_cover)
+
+        # A box which is not being squashed looks the same in every frame, so its whole tile is blitted at once.
+        if letterbox.bg_rect[3] == Constants.LETTERBOX_SIZE:
+            tile: Surface | SurfaceType = cls._get_letterbox_tile(letterbox.character, letterbox.bg_color, letterbox.text_color)
+            cls._screen.blit(tile, letterbox.bg_rect[:2])
+            cls._mark_dirty(dirty_rect)
+            return
 
         # Draw the box surface of the letter.
         pygame.draw.rect(cls._screen, letterbox.bg_color, letterbox.bg_rect)
@@ -96,44 +166,44 @@ class Ui:
             pygame.draw.rect(cls._screen, Color.FILLED_OUTLINE, letterbox.bg_rect, 3)
 
         # Draw the letter itself and scale with its containing box.
-        text_surface: Surface | SurfaceType = GUESSED_LETTER_FONT.render(letterbox.character, True, letterbox.text_color)
-        scaled_text_surface: Surface | SurfaceType = pygame.transform.scale(text_surface,  # Surface.
-                                                                            (text_surface.get_width(),  # New scaled size (x, y).
-                                                                             abs(text_surface.get_height() * (letterbox.bg_rect[3] / FONT_SCALE_FACTOR))))
+        scaled_text_surface: Surface | SurfaceType = cls._get_letterbox_glyph(letterbox.character, letterbox.text_color, letterbox.bg_rect[3])
         text_rect: Rect | RectType | None = scaled_text_surface.get_rect(center=letterbox.text_position)
         cls._screen.blit(scaled_text_surface, text_rect)
 
-        pygame.display.update()
+        cls._mark_dirty(dirty_rect.union(text_rect))
 
     @classmethod
+    @Profiler.timed("Ui.delete_letterbox_from_board")
     def delete_letterbox_from_board(cls, letterbox) -> None:
         # Fills the letter's spot with the default square, emptying it.
         pygame.draw.rect(cls._screen, Color.WHITE if cls.theme == Theme.LIGHT else Color.BLACK_BG, letterbox.bg_rect)
         pygame.draw.rect(cls._screen, Color.OUTLINE if cls.theme == Theme.LIGHT else Color.OUTLINE_DARK, letterbox.bg_rect, 3)
-        pygame.display.update()
+        cls._mark_dirty(letterbox.bg_rect)
 
     @classmethod
+    @Profiler.timed("Ui.display_game_over_frame")
     def display_game_over_frame(cls, frame_rect: Tuple[float, float, float, float], play_again_str: str, word_info_str: str, result_info: Tuple[str, str]):
         pygame.draw.rect(cls._screen, Color.WHITE if cls.theme == Theme.LIGHT else Color.BLACK_BG, frame_rect)
         result_text, result_color = result_info
         text_center_y: float = frame_rect[1] + (frame_rect[3] / 2)  # Y coord of the center of the box
         text_center_offset = 20  # Offset text by this much up or down to split strings.
 
-        result_text = PLAY_AGAIN_FONT.render(result_text, True, result_color)
+        result_text = cls._render_text(result_text, FontsName.PLAY_AGAIN, result_color)
         result_text_rect = result_text.get_rect(center=(Constants.WIDTH / 2, text_center_y - 4 * text_center_offset))
 
         text_color = Color.BLACK if cls.theme == Theme.LIGHT else Color.WHITE
-        play_again_text = PLAY_AGAIN_FONT.render(play_again_str, True, text_color)
+        play_again_text = cls._render_text(play_again_str, FontsName.PLAY_AGAIN, text_color)
         play_again_rect = play_again_text.get_rect(center=(Constants.WIDTH / 2, text_center_y - text_center_offset))
-        word_info_text = PLAY_AGAIN_FONT.render(word_info_str, True, text_color)
+        word_info_text = cls._render_text(word_info_str, FontsName.PLAY_AGAIN, text_color)
         word_info_rect = word_info_text.get_rect(center=(Constants.WIDTH / 2, text_center_y + text_center_offset))
         cls._screen.blit(result_text, result_text_rect)
         cls._screen.blit(word_info_text, word_info_rect)
         cls._screen.blit(play_again_text, play_again_rect)
-        pygame.display.update()
+        cls._mark_dirty(frame_rect)
 
     @classmethod
-    def display_popup(cls, message, indicators) -> None:
+    @Profiler.timed("Ui.display_popup")
+    def display_popup(cls, message) -> None:
         width: float = len(message) * 10 + 20
         height: float = 50
         x: float = Constants.WIDTH / 2 - (width / 2) - 8
@@ -144,23 +214,35 @@ class Ui:
         pygame.draw.rect(cls._screen, Color.BLACK, popup_rect, border_radius=10)
 
         # Draw text
-        message_text = MESSAGE_BOX_FONT.render(message, True, Color.WHITE)
+        message_text = cls._render_text(message, FontsName.MESSAGE_BOX, Color.WHITE)
         message_rect = message_text.get_rect(center=(x + (width / 2), y + (height / 2)))
         cls._screen.blit(message_text, message_rect)
 
-        pygame.display.update()
-
-        # Disappear after n seconds
-        t = threading.Thread(target=cls._hide_popup, kwargs={'hide_time': 1.0, 'indicators': indicators})
-        t.start()
+        cls._mark_dirty(popup_rect)
+        # A newer popup can be narrower than the one it replaces, whose edges are then cleared together with it.
+        cls._popup_rect = Rect(popup_rect) if cls._popup_rect is None else cls._popup_rect.union(popup_rect)
 
     @classmethod
-    def _hide_popup(cls, hide_time, indicators) -> None:
-        time.sleep(hide_time)
-
+    @Profiler.timed("Ui.hide_popup")
+    def hide_popup(cls) -> None:
+        # Only the area of the shown popups is cleared, as their width depends on the message.
+        if cls._popup_rect is None:
+            return
         pygame.draw.rect(cls._screen,
                          Color.WHITE if cls.theme == Theme.LIGHT else Color.BLACK_BG,
-                         (30, 700, 500, 100))
-        pygame.display.update()
-        for indicator in indicators:
-            indicator.draw()
+                         cls._popup_rect)
+        cls._mark_dirty(cls._popup_rect)
+        cls._popup_rect = None
+
+    @classmethod
+    def draw_profiler_overlay(cls, lines: List[str]) -> None:
+        # Drawn in the free space left of the difficulty buttons, above the board.
+        cls.hide_profiler_overlay()
+        for index, line in enumerate(lines):
+            text: Surface | SurfaceType = Assets.get_font(FontsName.CHOOSE_MODE).render(line, True, Color.BLACK if cls.theme == Theme.LIGHT else Color.WHITE)
+            cls._screen.blit(text, (PROFILER_OVERLAY_RECT[0], PROFILER_OVERLAY_RECT[1] + index * PROFILER_OVERLAY_LINE_HEIGHT))
+
+    @classmethod
+    def hide_profiler_overlay(cls) -> None:
+        pygame.draw.rect(cls._screen, Color.WHITE if cls.theme == Theme.LIGHT else Color.BLACK_BG, PROFILER_OVERLAY_RECT)
+        cls._mark_dirty(PROFILER_OVERLAY_RECT)
@@ -0,0 +1,59 @@
+from typing import Dict, List, Optional, Tuple
+
+from UI.button import Button
+
+GRID_CELL_SIZE: int = 64
+
+
+class WidgetLayer:
+    """
+    Class responsible for keeping buttons alive between frames. Buttons are drawn again only after being invalidated,
+    and the button under the cursor is found through a uniform grid instead of testing every button.
+
+    :param cell_size: size of a single square cell of the hit-testing grid
+    :type cell_size: int
+    """
+    _widgets: List[Button]
+    _grid: Dict[Tuple[int, int], List[Button]]
+    _dirty: Dict[int, Button]
+
+    def __init__(self, cell_size: int = GRID_CELL_SIZE):
+        self._cell_size = cell_size
+        self._widgets = []
+        self._grid = {}
+        self._dirty = {}
+
+    def __len__(self) -> int:
+        return len(self._widgets)
+
+    def add(self, widget: Button) -> None:
+        self._widgets.append(widget)
+        x, y, width, height = widget.rect
+        first_column, first_row = self._cell_of((x, y))
+        last_column, last_row = self._cell_of((x + width, y + height))
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                self._grid.setdefault((column, row), []).append(widget)
+
+    def invalidate(self, widget: Button) -> None:
+        self._dirty[id(widget)] = widget
+
+    def invalidate_all(self) -> None:
+        for widget in self._widgets:
+            self.invalidate(widget)
+
+    def redraw_dirty(self) -> None:
+        if not self._dirty:
+            return
+        for widget in self._dirty.values():
+            widget.draw()
+        self._dirty.clear()
+
+    def widget_at(self, position: Tuple[int, int]) -> Optional[Button]:
+        for widget in self._grid.get(self._cell_of(position), []):
+            if widget.is_point_colliding(position):
+                return widget
+        return None
+
+    def _cell_of(self, position: Tuple[float, float]) -> Tuple[int, int]:
+        return int(position[0] // self._cell_size), int(position[1] // self._cell_size)
@@ -0,0 +1,193 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+# The benchmarks never open a real window or audio device, so they can run on any machine.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from UI.letterbox import LetterBox
+from compiled_word_list import CompiledWordList
+from engine.pattern_index import PatternIndex
+from file_reader import FileReader
+from headless import run_games
+from models.difficulty import Difficulty
+from pyrdle import Pyrdle
+
+BASELINE_PATH: str = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD: float = 0.25  # A benchmark regresses when its best result is this much slower than the baseline.
+FRAME_TIME: float = 1 / 60
+# Every sample runs at least this long, in seconds, so timer resolution and short interruptions do not dominate fast operations.
+MIN_SAMPLE_TIME: float = 0.1
+
+
+def time_calls(function: Callable[[], None]) -> float:
+    # Average time of a single call, in milliseconds, over as many calls as fit in a sample.
+    calls: int = 0
+    start_time: float = time.perf_counter()
+    while time.perf_counter() - start_time < MIN_SAMPLE_TIME:
+        function()
+        calls += 1
+    return (time.perf_counter() - start_time) * 1000 / calls
+
+
+def time_steps(step: Callable[[], float]) -> float:
+    # Average of the durations returned by every step, in milliseconds, for steps which time only a part of their work.
+    steps: int = 0
+    elapsed_time: float = 0
+    while elapsed_time < MIN_SAMPLE_TIME:
+        elapsed_time += step()
+        steps += 1
+    return elapsed_time * 1000 / steps
+
+
+def benchmark_get_words(language: str, difficulty: Difficulty) -> Callable[[], float]:
+    file_reader = FileReader(language)
+
+    def load() -> float:
+        # The words are read again every time, instead of coming from the per-process cache.
+        FileReader.clear_word_lists()
+        start_time: float = time.perf_counter()
+        words: CompiledWordList = file_reader.get_words(difficulty)
+        elapsed_time: float = time.perf_counter() - start_time
+        del words
+        return elapsed_time
+    return lambda: time_steps(load)
+
+
+def benchmark_guess_validation(pyrdle: Pyrdle, rng: random.Random) -> Callable[[], float]:
+    words: List[str] = [word.upper() for word in pyrdle.configuration.words]
+    # Half of the checked guesses are not in the word list.
+    guesses: List[str] = [rng.choice(words) if index % 2 else "".join(rng.sample(words[0], len(words[0]))) for index in range(1000)]
+
+    def validate() -> None:
+        for guess in guesses:
+            pyrdle.is_valid_word(guess)
+    return lambda: time_calls(validate) / len(guesses)
+
+
+def benchmark_check_guess(pyrdle: Pyrdle, rng: random.Random) -> Callable[[], float]:
+    words: List[str] = [word.upper() for word in pyrdle.configuration.words]
+
+    def check() -> float:
+        if pyrdle.game.is_over:
+            pyrdle.set_default_game_statistic()
+        for letter in rng.choice(words):
+            pyrdle.create_new_letterbox(letter)
+        start_time: float = time.perf_counter()
+        pyrdle.check_guess(pyrdle.current_guess)
+        return time.perf_counter() - start_time
+
+    def run() -> float:
+        elapsed_time: float = time_steps(check)
+        pyrdle.set_default_game_statistic()
+        return elapsed_time
+    return run
+
+
+def benchmark_animation_frame(pyrdle: Pyrdle, animation: str) -> Callable[[], float]:
+    def animate() -> Tuple[int, float]:
+        # A whole row of letters animates at once, as after a guess or a rejected word. Returns the frames and their time.
+        letters: List[LetterBox] = [LetterBox(letter, (pyrdle.configuration.starting_offset_for_letter + index * 85, 45), pyrdle.theme)
+                                    for index, letter in enumerate(pyrdle.configuration.word.upper())]
+        for letter in letters:
+            getattr(letter, f"start_{animation}_animation")()
+        frames: int = 0
+        start_time: float = time.perf_counter()
+        while any(letter.is_flip_playing or letter.is_shake_playing for letter in letters):
+            for letter in letters:
+                letter.update(FRAME_TIME)
+            frames += 1
+        return frames, time.perf_counter() - start_time
+
+    def run() -> float:
+        frames: int = 0
+        elapsed_time: float = 0
+        while elapsed_time < MIN_SAMPLE_TIME:
+            animation_frames, animation_time = animate()
+            frames += animation_frames
+            elapsed_time += animation_time
+        return elapsed_time * 1000 / frames
+    return run
+
+
+def benchmark_pattern_query(pyrdle: Pyrdle, rng: random.Random) -> Callable[[], float]:
+    pattern_index: PatternIndex = pyrdle.configuration.word_index.pattern_index(pyrdle.configuration.number_of_letters)
+    # Queries like "A at 1, E somewhere but not at 4, no R, S or T", built from random words.
+    queries = [({0: word[0]}, [(3, word[1])], {word[1]: 1}, word[2:]) for word in rng.sample(pattern_index.words, 100)]
+
+    def query() -> None:
+        for letters_at, letters_not_at, minimum_counts, absent_letters in queries:
+            pattern_index.count(pattern_index.query(letters_at, letters_not_at, minimum_counts, absent_letters))
+    return lambda: time_calls(query) / len(queries)
+
+
+def benchmark_scripted_games() -> float:
+    return 1000 / run_games("english", Difficulty.EASY, 2000, seed=0)["games_per_second"]
+
+
+def get_benchmarks() -> Dict[str, Callable[[], float]]:
+    rng = random.Random(0)
+    pyrdle = Pyrdle("english", Difficulty.EASY, seed=0)  # Seeded, so the player's word samplers are left as they are.
+    benchmarks: Dict[str, Callable[[], float]] = {}
+    for language in FileReader.get_languages():
+        for difficulty in Difficulty:
+            benchmarks[f"get_words[{language}-{difficulty.value}]"] = benchmark_get_words(language, difficulty)
+    benchmarks["guess validation"] = benchmark_guess_validation(pyrdle, rng)
+    benchmarks["check_guess"] = benchmark_check_guess(pyrdle, rng)
+    benchmarks["pattern query"] = benchmark_pattern_query(pyrdle, rng)
+    benchmarks["flip animation frame"] = benchmark_animation_frame(pyrdle, "flip")
+    benchmarks["shake animation frame"] = benchmark_animation_frame(pyrdle, "shake")
+    benchmarks["scripted game"] = benchmark_scripted_games
+    return benchmarks
+
+
+def run_benchmarks(repeat: int) -> Dict[str, float]:
+    """
+    Runs every benchmark the given number of times and returns their best results, in milliseconds per operation.
+    The best result is the least affected by other processes, so it is the most stable between runs.
+    """
+    results: Dict[str, float] = {}
+    for name, benchmark in get_benchmarks().items():
+        results[name] = min(benchmark() for _ in range(repeat))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measures Pyrdle's hot paths and compares them with the stored baseline.")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    arguments = parser.parse_args()
+
+    results: Dict[str, float] = run_benchmarks(arguments.repeat)
+    baseline: Dict[str, float] = {}
+    if os.path.exists(arguments.baseline):
+        with open(arguments.baseline, encoding="utf8") as file:
+            baseline = json.load(file)
+
+    regressions: List[str] = []
+    for name, best in results.items():
+        line: str = f"{name:<32} {best:12.6f} ms"
+        if name in baseline:
+            change: float = best / baseline[name] - 1
+            line += f" {change:+8.1%}"
+            if change > arguments.threshold:
+                regressions.append(name)
+                line += " REGRESSION"
+        print(line)
+
+    if arguments.save_baseline:
+        with open(arguments.baseline, "w", encoding="utf8") as file:
+            json.dump(results, file, indent=2)
+    elif regressions:
+        sys.exit(f"{len(regressions)} benchmark(s) slower than the baseline by more than {arguments.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import codecs
+import csv
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, Sequence, Tuple, overload
+
+import numpy as np
+
+from utils.checksum import file_checksum
+
+COMPILED_WORD_LIST_EXTENSION: str = ".words"
+COMPILED_WORD_LIST_MAGIC: bytes = b"PYRDLWL2"
+# Magic, checksum of the source file and the number of sections.
+FILE_HEADER = struct.Struct("<8s32sI")
+# Word length, number of words and offset of the first letter in the file. One per section.
+SECTION_HEADER = struct.Struct("<IIQ")
+# Code points are stored as 4-byte little-endian integers on every platform, which is also UTF-32-LE.
+CODE_POINT_DTYPE = np.dtype("<u4")
+
+
+def compile_word_list(source_path: str, compiled_path: str) -> None:
+    """
+    Converts a word file into fixed-width sections, one for every word length, where each letter is stored as a
+    4-byte code point. Words keep their order within a section.
+    """
+    with open(source_path, encoding="utf8") as file:
+        words: List[str] = next(csv.reader(file), [])
+    sections: Dict[int, List[str]] = {}
+    for word in words:
+        word = word.strip()
+        if word != "":
+            sections.setdefault(len(word), []).append(word)
+
+    data_offset: int = FILE_HEADER.size + SECTION_HEADER.size * len(sections)
+    headers: List[bytes] = []
+    for word_length, section_words in sections.items():
+        headers.append(SECTION_HEADER.pack(word_length, len(section_words), data_offset))
+        data_offset += CODE_POINT_DTYPE.itemsize * word_length * len(section_words)
+
+    # Written under a temporary name first, so an interrupted compilation is never loaded.
+    temporary_path: str = compiled_path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(FILE_HEADER.pack(COMPILED_WORD_LIST_MAGIC, file_checksum(source_path), len(sections)))
+        file.writelines(headers)
+        for section_words in sections.values():
+            file.write(codecs.utf_32_le_encode("".join(section_words))[0])
+    os.replace(temporary_path, compiled_path)
+
+
+class CompiledWordList(Sequence[str]):
+    """
+    Class responsible for reading a compiled word file through mmap. Words are decoded only when accessed,
+    so the letters are shared through the page cache instead of being copied into every process.
+    Words are indexed in the order of the sections, then in the order of the source file within a section.
+
+    :param path: path of the compiled word file
+    :type path: str
+    """
+    path: str
+    _sections: List[Tuple[int, int, np.ndarray]]
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.checksum, sections_count = FILE_HEADER.unpack_from(self._mmap)
+        if magic != COMPILED_WORD_LIST_MAGIC:
+            raise ValueError(f"{path} is not a compiled word list")
+
+        self._sections = []
+        for section in range(sections_count):
+            word_length, words_count, offset = SECTION_HEADER.unpack_from(self._mmap, FILE_HEADER.size + section * SECTION_HEADER.size)
+            code_points: np.ndarray = np.frombuffer(self._mmap, dtype=CODE_POINT_DTYPE, count=word_length * words_count, offset=offset)
+            self._sections.append((word_length, words_count, code_points))
+
+    def __len__(self) -> int:
+        return sum(words_count for _, words_count, _ in self._sections)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | List[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        for word_length, words_count, code_points in self._sections:
+            if 0 <= index < words_count:
+                return decode_code_points(code_points[index * word_length:(index + 1) * word_length])
+            index -= words_count
+        raise IndexError("word index out of range")
+
+    def __iter__(self) -> Iterator[str]:
+        for word_length, _, _ in self._sections:
+            yield from self.words_of_length(word_length)
+
+    def close(self) -> None:
+        # The arrays keep the mmap's buffer exported, so they have to be dropped before it is closed.
+        self._sections = []
+        self._mmap.close()
+
+    @property
+    def word_lengths(self) -> List[int]:
+        return [word_length for word_length, _, _ in self._sections]
+
+    def get_code_points(self, word_length: int) -> np.ndarray:
+        # Letters of all words of the given length, as one flat array of code points.
+        for section_word_length, _, code_points in self._sections:
+            if section_word_length == word_length:
+                return code_points
+        return np.zeros(0, dtype=CODE_POINT_DTYPE)
+
+    def words_of_length(self, word_length: int) -> List[str]:
+        # The whole section is decoded at once, which is much faster than word by word.
+        letters: str = decode_code_points(self.get_code_points(word_length))
+        return [letters[start:start + word_length] for start in range(0, len(letters), word_length)]
+
+
+def decode_code_points(code_points: np.ndarray) -> str:
+    return codecs.utf_32_le_decode(code_points.tobytes())[0]
+
+
+def load_compiled_word_list(source_path: str) -> CompiledWordList:
+    # The word file is compiled again whenever it no longer matches its source.
+    compiled_path: str = os.path.splitext(source_path)[0] + COMPILED_WORD_LIST_EXTENSION
+    checksum: bytes = file_checksum(source_path)
+    if os.path.exists(compiled_path):
+        try:
+            word_list = CompiledWordList(compiled_path)
+        except (ValueError, struct.error):
+            pass
+        else:
+            if word_list.checksum == checksum:
+                return word_list
+            word_list.close()
+    compile_word_list(source_path, compiled_path)
+    return CompiledWordList(compiled_path)
@@ -1,14 +1,22 @@
-import random
-from typing import List, Dict
+import threading
+from typing import List, Dict, Tuple
 
+from UI.assets import Assets
 from UI.choose_mode_button import ChooseModeButton
 from UI.indicator import Indicator
 from UI.ui import Ui
+from UI.widget_layer import WidgetLayer
 from constants import Constants
+from engine.feedback_matrix import FeedbackMatrix
+from engine.solver import EntropySolver
+from engine.suggestions import SuggestionIndex
+from engine.word_sampler import WordSampler, read_frequencies
 from file_reader import FileReader
 from models.Theme import Theme
 from models.color import Color
 from models.difficulty import Difficulty
+from models.sampling_mode import SamplingMode
+from word_index import WordIndex
 
 
 class Configuration:
@@ -19,38 +27,80 @@ class Configuration:
     :type chosen_language: str
     :param chosen_difficulty: difficulty as in a number of letters in words
     :type chosen_difficulty: Difficulty(str, Enum)
+    :param prefetch_backgrounds: whether backgrounds of all modes are loaded on a background thread at startup
+    :type prefetch_backgrounds: bool
+    :param seed: seed of the drawn words, which continue from the previous session when not given
+    :type seed: int | None
+    :param sampling_mode: how the words are drawn
+    :type sampling_mode: SamplingMode(str, Enum)
+    :param sampler_states: seed and number of draws of every mode's sampler, i.e. of a recorded session, which takes precedence over the seed
+    :type sampler_states: Dict[Difficulty, Tuple[int, int]] | None
     """
     file_reader: FileReader
+    word_index: WordIndex
     words: List[str]
     word: str
     starting_offset_for_letter: int
     number_of_letters: int
     theme: Theme
 
-    def __init__(self, chosen_language: str, chosen_difficulty: Difficulty, theme: Theme):
+    def __init__(self, chosen_language: str, chosen_difficulty: Difficulty, theme: Theme, prefetch_backgrounds: bool = True, seed: int | None = None,
+                 sampling_mode: SamplingMode = SamplingMode.SHUFFLE_BAG, sampler_states: Dict[Difficulty, Tuple[int, int]] | None = None):
         # Setup window, difficulty and UI.
         self.theme = theme
         self.file_reader = FileReader(chosen_language)
+        self.sampling_mode = sampling_mode
+        # Only the samplers of unseeded sessions are stored, so replaying a session does not move the player's own.
+        self.persist_samplers: bool = sampler_states is None and seed is None
+        if sampler_states is None:
+            sampler_states = {difficulty: (seed, 0) if seed is not None else WordSampler.load_state(self.get_sampler_state_path(difficulty))
+                              for difficulty in Difficulty}
+        self.initial_sampler_states: Dict[Difficulty, Tuple[int, int]] = sampler_states  # Known upfront, so the session can be recorded.
+        self.samplers: Dict[Difficulty, WordSampler] = {}  # Created with the mode's word index.
+        self.word_indexes: Dict[Difficulty, WordIndex] = {}  # Built once per difficulty, so switching back is instant.
+        self.suggestion_indexes: Dict[Difficulty, SuggestionIndex] = {}  # Filled by the prefetching threads.
+        self._suggestion_threads: Dict[Difficulty, threading.Thread] = {}
+        self.solvers: Dict[Difficulty, EntropySolver] = {}  # Filled by the prefetching threads, reset before every use.
+        self._solver_threads: Dict[Difficulty, threading.Thread] = {}
         self.chosen_difficulty: Difficulty = chosen_difficulty
         background_path: str = self.set_mode_configuration(chosen_difficulty)
         self.window_height: int = Constants.HEIGHT if self.file_reader.language_specific_letters == "" else Constants.HEIGHT_EXT
         Ui(self.window_height, background_path, theme)
+        if prefetch_backgrounds:
+            # Backgrounds of the other modes are loaded in the meantime, so switching to them does not touch the disk.
+            Assets.prefetch_images(Constants.BACKGROUND_PATHS)
 
         self.indicators: List[Indicator] = []
-        self.choose_difficulty_buttons: List[ChooseModeButton] = []
+        self.indicators_by_letter: Dict[str, Indicator] = {}
+        self.choose_difficulty_buttons: Dict[Difficulty, ChooseModeButton] = {}
+        self.widgets: WidgetLayer = WidgetLayer()
         self.current_letter_bg_x: int = self.starting_offset_for_letter
 
     def update_configuration(self, chosen_difficulty: str) -> None:
         background_path: str = self.set_mode_configuration(chosen_difficulty)
         self.current_letter_bg_x: int = self.starting_offset_for_letter
         Ui.update_background(background_path)
+        self.refresh_difficulty_buttons()
 
-    def setup_difficulty_buttons(self) -> None:
+    def get_difficulty_colors(self) -> Dict[Difficulty, Color]:
         themed_color = Color.OUTLINE_DARK if self.theme == Theme.DARK else Color.OUTLINE
-        difficulty_colors: Dict[Difficulty, Color] = {Difficulty.EASY: themed_color, Difficulty.MEDIUM: themed_color, Difficulty.HARD: themed_color, self.chosen_difficulty: Color.GREEN}
-        self.choose_difficulty_buttons.append(ChooseModeButton(Constants.WIDTH - 105, 5, Difficulty.EASY, difficulty_colors[Difficulty.EASY]))
-        self.choose_difficulty_buttons.append(ChooseModeButton(Constants.WIDTH - 215, 5, Difficulty.MEDIUM, difficulty_colors[Difficulty.MEDIUM]))
-        self.choose_difficulty_buttons.append(ChooseModeButton(Constants.WIDTH - 325, 5, Difficulty.HARD, difficulty_colors[Difficulty.HARD]))
+        return {Difficulty.EASY: themed_color, Difficulty.MEDIUM: themed_color, Difficulty.HARD: themed_color, self.chosen_difficulty: Color.GREEN}
+
+    def setup_difficulty_buttons(self) -> None:
+        # Buttons are created only once and kept in the widget layer, which redraws them when they change.
+        difficulty_colors: Dict[Difficulty, Color] = self.get_difficulty_colors()
+        positions_x: Dict[Difficulty, float] = {Difficulty.EASY: Constants.WIDTH - 105, Difficulty.MEDIUM: Constants.WIDTH - 215, Difficulty.HARD: Constants.WIDTH - 325}
+        for difficulty, position_x in positions_x.items():
+            button = ChooseModeButton(position_x, 5, difficulty, difficulty_colors[difficulty])
+            self.choose_difficulty_buttons[difficulty] = button
+            self.widgets.add(button)
+
+    def refresh_difficulty_buttons(self) -> None:
+        difficulty_colors: Dict[Difficulty, Color] = self.get_difficulty_colors()
+        for difficulty, button in self.choose_difficulty_buttons.items():
+            if button.bg_color != difficulty_colors[difficulty]:
+                button.bg_color = difficulty_colors[difficulty]
+                self.widgets.invalidate(button)
 
     def initialize_keyboard(self) -> None:
         indicator_position_y: int = Constants.FIRST_INDICATOR_POSITION_Y
@@ -59,37 +109,104 @@ class Configuration:
             x_offset = (Constants.WIDTH - len(Constants.BASIC_INDICATORS[i]) * 60)/2
             if i == 2:
                 enter = Indicator(x_offset - 91, indicator_position_y, "Enter", self.theme, 100 - Constants.LETTERBOX_Y_SPACING)
-                self.indicators.append(enter)
+                self.add_indicator(enter)
 
             for letter in Constants.BASIC_INDICATORS[i]:
                 new_indicator = Indicator(x_offset, indicator_position_y, letter, self.theme)
-                self.indicators.append(new_indicator)
+                self.add_indicator(new_indicator)
                 x_offset += 60
             indicator_position_y += 90
 
         backspace = Indicator(x_offset, indicator_position_y-90, "BckSp", self.theme, 100)
-        self.indicators.append(backspace)
+        self.add_indicator(backspace)
 
         x_offset = (Constants.WIDTH - len(self.file_reader.language_specific_letters) * 60)/2
         for letter in self.file_reader.language_specific_letters:
             new_indicator = Indicator(x_offset, indicator_position_y, letter, self.theme)
-            self.indicators.append(new_indicator)
+            self.add_indicator(new_indicator)
             x_offset += 60
 
+    def add_indicator(self, indicator: Indicator) -> None:
+        # Indicators are found by their letter when scoring, and through the widget layer's grid when clicked.
+        self.indicators.append(indicator)
+        self.indicators_by_letter[indicator.text] = indicator
+        self.widgets.add(indicator)
+
     def set_mode_configuration(self, chosen_difficulty: Difficulty | str):
         self.chosen_difficulty = chosen_difficulty
-        self.words = self.file_reader.get_words(chosen_difficulty)
+        if chosen_difficulty not in self.word_indexes:
+            self.word_indexes[chosen_difficulty] = WordIndex(self.file_reader.get_words(chosen_difficulty))
+        self.word_index = self.word_indexes[chosen_difficulty]
         if chosen_difficulty == Difficulty.EASY:
             self.starting_offset_for_letter = Constants.EASY_DIFFICULTY_OFFSET
             self.number_of_letters = Constants.EASY_DIFFICULTY_LETTERS
-            return Constants.EASY_DIFFICULTY_BACKGROUND_PATH if self.theme == Theme.LIGHT else Constants.EASY_DIFFICULTY_DARK_BACKGROUND_PATH
+            background_path = Constants.EASY_DIFFICULTY_BACKGROUND_PATH if self.theme == Theme.LIGHT else Constants.EASY_DIFFICULTY_DARK_BACKGROUND_PATH
         elif chosen_difficulty == Difficulty.MEDIUM:
             self.starting_offset_for_letter = Constants.MEDIUM_DIFFICULTY_OFFSET
             self.number_of_letters = Constants.MEDIUM_DIFFICULTY_LETTERS
-            return Constants.MEDIUM_DIFFICULTY_BACKGROUND_PATH if self.theme == Theme.LIGHT else Constants.MEDIUM_DIFFICULTY_DARK_BACKGROUND_PATH
+            background_path = Constants.MEDIUM_DIFFICULTY_BACKGROUND_PATH if self.theme == Theme.LIGHT else Constants.MEDIUM_DIFFICULTY_DARK_BACKGROUND_PATH
         else:
             self.starting_offset_for_letter = Constants.HARD_DIFFICULTY_OFFSET
             self.number_of_letters = Constants.HARD_DIFFICULTY_LETTERS
-            return Constants.HARD_DIFFICULTY_BACKGROUND_PATH if self.theme == Theme.LIGHT else Constants.HARD_DIFFICULTY_DARK_BACKGROUND_PATH
+            background_path = Constants.HARD_DIFFICULTY_BACKGROUND_PATH if self.theme == Theme.LIGHT else Constants.HARD_DIFFICULTY_DARK_BACKGROUND_PATH
+        # Only words of the mode's length can be drawn, which also skips empty entries in the dictionary files.
+        self.words = self.word_index.words_of_length(self.number_of_letters)
+        if chosen_difficulty not in self.samplers:
+            self.samplers[chosen_difficulty] = self.create_sampler(chosen_difficulty)
+        return background_path
+
+    def get_sampler_state_path(self, difficulty: Difficulty) -> str:
+        return WordSampler.get_state_path(self.file_reader.get_words_path(difficulty))
+
+    def create_sampler(self, difficulty: Difficulty) -> WordSampler:
+        weights: List[float] | None = None
+        if self.sampling_mode == SamplingMode.WEIGHTED:
+            # Words without a frequency are drawn as often as the rarest word with one.
+            frequencies: Dict[str, float] = read_frequencies(self.file_reader.get_words_path(difficulty))
+            if frequencies:
+                default_frequency: float = min(frequencies.values())
+                weights = [frequencies.get(word, default_frequency) for word in self.words]
+        seed, draws = self.initial_sampler_states[difficulty]
+        return WordSampler(self.words, self.sampling_mode, seed, draws, weights,
+                           self.get_sampler_state_path(difficulty) if self.persist_samplers else None)
+
+    def is_valid_word(self, word: str) -> bool:
+        return word in self.word_index
+
+    def prefetch_suggestion_index(self) -> None:
+        # Building the index takes longer than a frame for the biggest dictionaries, so it is done on a background thread.
+        difficulty: Difficulty = self.chosen_difficulty
+        if difficulty in self._suggestion_threads:
+            return
+        words: List[str] = self.words
+        language_specific_letters: str = self.file_reader.language_specific_letters
+
+        def build_index() -> None:
+            self.suggestion_indexes[difficulty] = SuggestionIndex(words, language_specific_letters)
+
+        thread = threading.Thread(target=build_index, name="suggestion-index", daemon=True)
+        thread.start()
+        self._suggestion_threads[difficulty] = thread
+
+    def prefetch_solver(self, hard_mode: bool) -> None:
+        # The feedback matrix is built on the first use of a dictionary, which takes seconds, and loading it takes a few frames.
+        difficulty: Difficulty = self.chosen_difficulty
+        if difficulty in self._solver_threads:
+            return
+        words: List[str] = self.words
+        words_path: str = self.file_reader.get_words_path(difficulty)
+
+        def build_solver() -> None:
+            self.solvers[difficulty] = EntropySolver(FeedbackMatrix.load_or_build(words_path, words), hard_mode)
+
+        thread = threading.Thread(target=build_solver, name="solver", daemon=True)
+        thread.start()
+        self._solver_threads[difficulty] = thread
+
+    def get_suggestions(self, guess: str) -> List[str]:
+        # No suggestions until the index of the mode is built.
+        suggestion_index: SuggestionIndex | None = self.suggestion_indexes.get(self.chosen_difficulty)
+        return suggestion_index.suggest(guess) if suggestion_index is not None else []
+
     def draw_new_word(self):
-        self.word = random.choice(self.words)
+        self.word = self.samplers[self.chosen_difficulty].draw()
@@ -33,6 +33,9 @@ class Constants:
     MEDIUM_DIFFICULTY_DARK_BACKGROUND_PATH: str = "resources/medium_mode_dark.png"
     HARD_DIFFICULTY_DARK_BACKGROUND_PATH: str = "resources/hard_mode_dark.png"
 
+    BACKGROUND_PATHS: List[str] = [EASY_DIFFICULTY_BACKGROUND_PATH, MEDIUM_DIFFICULTY_BACKGROUND_PATH, HARD_DIFFICULTY_BACKGROUND_PATH,
+                                   EASY_DIFFICULTY_DARK_BACKGROUND_PATH, MEDIUM_DIFFICULTY_DARK_BACKGROUND_PATH, HARD_DIFFICULTY_DARK_BACKGROUND_PATH]
+
     ICON_PATH: str = "resources/Icon.png"
 
     WINDOW_TITLE: str = "Pyrdle!"
@@ -0,0 +1,76 @@
+from typing import Dict, Sequence
+
+import numpy as np
+
+# Number of guess letters compared with the words at once, which bounds the size of intermediate arrays.
+BLOCK_ELEMENTS: int = 1 << 18
+
+
+class BatchScorer:
+    """
+    Class responsible for scoring guesses against a whole word list at once, with the same rules as engine.scoring.
+    Results are base-3 feedback codes (see engine.scoring.encode_feedback), one per scored word.
+
+    :param words: lowercase words of the same length, against which guesses are scored
+    :type words: Sequence[str]
+    """
+    words: Sequence[str]
+    length: int
+    code_dtype: type
+    encoded_words: np.ndarray
+
+    def __init__(self, words: Sequence[str]):
+        self.words = words
+        self.length = len(words[0]) if words else 0
+        # Letters are stored as small integers, 0 is reserved for letters which do not occur in any word.
+        letters = sorted(set("".join(words)))
+        self._letter_codes: Dict[str, int] = {letter: code for code, letter in enumerate(letters, start=1)}
+        self._letter_dtype = np.uint8 if len(letters) < np.iinfo(np.uint8).max else np.uint16
+        # 3^5 codes fit into a single byte, longer words need two.
+        self.code_dtype = np.uint8 if 3 ** self.length <= np.iinfo(np.uint8).max + 1 else np.uint16
+        self.encoded_words = self.encode(words)
+        # Number of copies of every letter in every word, indexed by [letter code, word].
+        self.letter_counts = np.zeros((len(letters) + 1, len(words)), dtype=np.int8)
+        for position in range(self.length):
+            np.add.at(self.letter_counts, (self.encoded_words[:, position], np.arange(len(words))), 1)
+
+    def encode(self, words: Sequence[str]) -> np.ndarray:
+        encoded = np.zeros((len(words), self.length), dtype=self._letter_dtype)
+        for row, word in enumerate(words):
+            encoded[row] = [self._letter_codes.get(letter, 0) for letter in word]
+        return encoded
+
+    def score(self, guess: str) -> np.ndarray:
+        return self.score_encoded(self.encode([guess.lower()]))[0]
+
+    def score_many(self, guesses: Sequence[str]) -> np.ndarray:
+        return self.score_encoded(self.encode([guess.lower() for guess in guesses]))
+
+    def score_encoded(self, encoded_guesses: np.ndarray) -> np.ndarray:
+        codes = np.empty((len(encoded_guesses), len(self.encoded_words)), dtype=self.code_dtype)
+        block_size: int = max(1, BLOCK_ELEMENTS // max(1, len(self.encoded_words) * self.length))
+        for start in range(0, len(encoded_guesses), block_size):
+            codes[start:start + block_size] = self._score_block(encoded_guesses[start:start + block_size])
+        return codes
+
+    def _score_block(self, guesses: np.ndarray) -> np.ndarray:
+        # Indexed by [position, guess, word], so every position is a contiguous block.
+        correct: np.ndarray = guesses.T[:, :, np.newaxis] == self.encoded_words.T[:, np.newaxis, :]
+        codes = np.zeros((len(guesses), len(self.encoded_words)), dtype=self.code_dtype)
+        weight: int = 1
+        for i in range(self.length):
+            letter: np.ndarray = guesses[:, i]
+            # A guess letter which is not correct is present, when the word has more copies of it than are claimed
+            # by the same letter on other positions of the guess. Copies are claimed by every earlier occurrence,
+            # and by every later occurrence that is correct.
+            unclaimed: np.ndarray = self.letter_counts[letter]
+            unclaimed -= (guesses[:, :i] == letter[:, np.newaxis]).sum(axis=1, dtype=np.int8)[:, np.newaxis]
+            for j in range(i + 1, self.length):
+                same_letter: np.ndarray = guesses[:, j] == letter
+                if same_letter.any():
+                    unclaimed -= correct[j] & same_letter[:, np.newaxis]
+
+            present: np.ndarray = ~correct[i] & (unclaimed > 0)
+            codes += (2 * correct[i] + present).astype(self.code_dtype) * self.code_dtype(weight)
+            weight *= 3
+        return codes
@@ -0,0 +1,54 @@
+from typing import Dict, List, Sequence
+
+from models.feedback import Feedback
+
+ORDINAL_SUFFIXES: Dict[int, str] = {1: "st", 2: "nd", 3: "rd"}
+
+
+class HardModeConstraints:
+    """
+    Class responsible for the hard mode rule: every guess has to keep the revealed correct letters on their positions,
+    and contain every revealed present letter. The constraints are updated with every scored guess, so checking
+    a guess takes time proportional to the word length, however many guesses were made before.
+
+    :param word_length: number of letters in every guess
+    :type word_length: int
+    """
+    __slots__ = ("correct_letters", "minimum_counts")
+    correct_letters: List[str]
+    minimum_counts: Dict[str, int]
+
+    def __init__(self, word_length: int):
+        self.correct_letters = [""] * word_length  # Empty while the letter on the position is not known.
+        self.minimum_counts = {}  # How many copies of a letter every guess has to contain.
+
+    def update(self, guess: str, feedback: Sequence[Feedback]) -> None:
+        revealed_counts: Dict[str, int] = {}
+        for i, (letter, letter_feedback) in enumerate(zip(guess, feedback)):
+            if letter_feedback == Feedback.CORRECT:
+                self.correct_letters[i] = letter
+            if letter_feedback != Feedback.ABSENT:
+                revealed_counts[letter] = revealed_counts.get(letter, 0) + 1
+        for letter, count in revealed_counts.items():
+            if count > self.minimum_counts.get(letter, 0):
+                self.minimum_counts[letter] = count
+
+    def get_violation(self, guess: str) -> str | None:
+        # Returns the message shown to the player, or None when the guess is allowed.
+        for i, letter in enumerate(self.correct_letters):
+            if letter and guess[i] != letter:
+                return f"{i + 1}{ORDINAL_SUFFIXES.get(i + 1, 'th')} letter must be {letter.upper()}"
+        for letter, count in self.minimum_counts.items():
+            if guess.count(letter) < count:
+                return f"Guess must contain {letter.upper()}" if count == 1 else f"Guess must contain {count} {letter.upper()}'s"
+        return None
+
+    def allows(self, guess: str) -> bool:
+        # Same checks as get_violation, without building the message, as solvers check many words at once.
+        for i, letter in enumerate(self.correct_letters):
+            if letter and guess[i] != letter:
+                return False
+        for letter, count in self.minimum_counts.items():
+            if guess.count(letter) < count:
+                return False
+        return True
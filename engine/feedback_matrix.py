@@ -0,0 +1,113 @@
+import os
+import struct
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from engine.batch_scoring import BatchScorer
+from engine.game_state import LETTERS_BY_DIFFICULTY
+from file_reader import FileReader
+from models.difficulty import Difficulty
+from utils.checksum import file_checksum
+from word_index import WordIndex
+
+FEEDBACK_MATRIX_EXTENSION: str = ".feedback"
+FEEDBACK_MATRIX_MAGIC: bytes = b"PYRDLFM1"
+# Magic, checksum of the source file, number of words, word length and size of a single code in bytes.
+FEEDBACK_MATRIX_HEADER = struct.Struct("<8s32sIII")
+
+
+class FeedbackMatrix:
+    """
+    Class responsible for the feedback of every guess against every word of a dictionary, stored as base-3 codes
+    (see engine.scoring.encode_feedback). Rows are guesses and columns are words, both in the order of words.
+
+    :param words: lowercase words of the same length, indexing both rows and columns
+    :type words: Sequence[str]
+    :param codes: square matrix of feedback codes
+    :type codes: np.ndarray
+    """
+    words: Sequence[str]
+    codes: np.ndarray
+
+    def __init__(self, words: Sequence[str], codes: np.ndarray):
+        self.words = words
+        self.codes = codes
+        self._indexes: Dict[str, int] = {word: index for index, word in enumerate(words)}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word.lower() in self._indexes
+
+    def index_of(self, word: str) -> int:
+        return self._indexes[word.lower()]
+
+    def feedback(self, guess: str, word: str) -> int:
+        return int(self.codes[self.index_of(guess), self.index_of(word)])
+
+    @classmethod
+    def build(cls, words: Sequence[str]) -> "FeedbackMatrix":
+        return cls(words, BatchScorer(words).score_many(words))
+
+    @classmethod
+    def load_or_build(cls, source_path: str, words: Sequence[str]) -> "FeedbackMatrix":
+        """
+        Memory-maps the matrix stored next to the source word file, building it first when it is missing
+        or when it was built from a different version of the source file. A mode without words has an empty matrix,
+        which is not stored.
+        """
+        if not words:
+            return cls(words, np.zeros((0, 0), dtype=np.uint8))
+        matrix_path: str = os.path.splitext(source_path)[0] + FEEDBACK_MATRIX_EXTENSION
+        expected_header: Tuple[bytes, bytes, int, int] = (FEEDBACK_MATRIX_MAGIC, file_checksum(source_path), len(words), len(words[0]))
+        header: Tuple[bytes, bytes, int, int, int] | None = cls._read_header(matrix_path)
+        if header is None or header[:4] != expected_header:
+            cls._write(matrix_path, expected_header[1], words)
+            header = cls._read_header(matrix_path)
+
+        code_dtype = np.uint8 if header[4] == 1 else np.uint16
+        codes = np.memmap(matrix_path, dtype=code_dtype, mode="r", offset=FEEDBACK_MATRIX_HEADER.size, shape=(len(words), len(words)))
+        return cls(words, codes)
+
+    @staticmethod
+    def _read_header(matrix_path: str) -> Tuple[bytes, bytes, int, int, int] | None:
+        if not os.path.exists(matrix_path):
+            return None
+        with open(matrix_path, "rb") as file:
+            header: bytes = file.read(FEEDBACK_MATRIX_HEADER.size)
+        if len(header) != FEEDBACK_MATRIX_HEADER.size:
+            return None
+        return FEEDBACK_MATRIX_HEADER.unpack(header)
+
+    @staticmethod
+    def _write(matrix_path: str, checksum: bytes, words: Sequence[str]) -> None:
+        # Rows are scored and written in chunks, so the whole matrix never has to fit in memory.
+        # The file is written under a temporary name first, so an interrupted build is never loaded.
+        scorer = BatchScorer(words)
+        temporary_path: str = matrix_path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(FEEDBACK_MATRIX_HEADER.pack(FEEDBACK_MATRIX_MAGIC, checksum, len(words), len(words[0]), np.dtype(scorer.code_dtype).itemsize))
+            chunk_size: int = 512
+            for start in range(0, len(words), chunk_size):
+                file.write(scorer.score_encoded(scorer.encoded_words[start:start + chunk_size]).tobytes())
+        os.replace(temporary_path, matrix_path)
+
+
+def load_feedback_matrix(file_reader: FileReader, difficulty: Difficulty) -> FeedbackMatrix:
+    words: List[str] = WordIndex(file_reader.get_words(difficulty)).words_of_length(LETTERS_BY_DIFFICULTY[difficulty])
+    return FeedbackMatrix.load_or_build(file_reader.get_words_path(difficulty), words)
+
+
+def main() -> None:
+    # Builds the matrices of every language and difficulty from the config, so they are ready before the game starts.
+    for language in FileReader.get_languages():
+        file_reader = FileReader(language)
+        for difficulty in Difficulty:
+            matrix: FeedbackMatrix = load_feedback_matrix(file_reader, difficulty)
+            print(f"{language} {difficulty.value}: {len(matrix)}x{len(matrix)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+from typing import Dict, List, Tuple
+
+from constants import Constants
+from engine.constraints import HardModeConstraints
+from engine.scoring import score_guess
+from models.difficulty import Difficulty
+from models.feedback import Feedback
+from models.game_result import GameResult
+
+MAX_GUESSES: int = 6
+LETTERS_BY_DIFFICULTY: Dict[Difficulty, int] = {
+    Difficulty.EASY: Constants.EASY_DIFFICULTY_LETTERS,
+    Difficulty.MEDIUM: Constants.MEDIUM_DIFFICULTY_LETTERS,
+    Difficulty.HARD: Constants.HARD_DIFFICULTY_LETTERS
+}
+
+
+class GameState:
+    """
+    Class responsible for the rules of a single game, independent of pygame and the UI.
+    Guesses and their feedback are kept as plain strings and tuples, which scoring and the solvers use directly.
+
+    :param word: drawn word, which has to be guessed
+    :type word: str
+    :param max_guesses: number of guesses after which the game is lost
+    :type max_guesses: int
+    :param hard_mode: whether every guess has to use the letters revealed by the previous ones
+    :type hard_mode: bool
+    """
+    __slots__ = ("word", "max_guesses", "guesses", "feedback", "result", "constraints")  # Servers keep thousands of games at once.
+    word: str
+    max_guesses: int
+    guesses: List[str]
+    feedback: List[Tuple[Feedback, ...]]
+    result: GameResult
+    constraints: HardModeConstraints | None
+
+    def __init__(self, word: str, max_guesses: int = MAX_GUESSES, hard_mode: bool = False):
+        self.word = word.lower()
+        self.max_guesses = max_guesses
+        self.guesses = []
+        self.feedback = []
+        self.result = GameResult.NOT_DECIDED
+        self.constraints = HardModeConstraints(len(self.word)) if hard_mode else None
+
+    @property
+    def guesses_count(self) -> int:
+        return len(self.guesses)
+
+    @property
+    def is_over(self) -> bool:
+        return self.result != GameResult.NOT_DECIDED
+
+    def get_hard_mode_violation(self, guess: str) -> str | None:
+        return self.constraints.get_violation(guess.lower()) if self.constraints is not None else None
+
+    def submit_guess(self, guess: str) -> Tuple[Feedback, ...]:
+        if self.is_over:
+            raise ValueError("The game is already over")
+        guess = guess.lower()
+        if len(guess) != len(self.word):
+            raise ValueError(f"Guess has to be {len(self.word)} letters long")
+        violation: str | None = self.get_hard_mode_violation(guess)
+        if violation is not None:
+            raise ValueError(violation)
+
+        guess_feedback: Tuple[Feedback, ...] = score_guess(guess, self.word)
+        if self.constraints is not None:
+            self.constraints.update(guess, guess_feedback)
+        self.guesses.append(guess)
+        self.feedback.append(guess_feedback)
+
+        if guess == self.word:
+            self.result = GameResult.WIN
+        elif len(self.guesses) == self.max_guesses:
+            self.result = GameResult.LOSE
+        return guess_feedback
@@ -0,0 +1,104 @@
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from engine.constraints import HardModeConstraints
+from models.feedback import Feedback
+
+
+class PatternIndex:
+    """
+    Class responsible for answering letter pattern queries, i.e. "A at 1, E somewhere but not at 4, no R, S or T",
+    over a list of words of the same length. Every (position, letter) and (letter, minimum count) pair is mapped to a bitset
+    of the words matching it, with the n-th bit standing for the n-th word, so a query is a few bitwise ANDs
+    instead of a scan of the strings.
+
+    :param words: lowercase words of the same length
+    :type words: Sequence[str]
+    """
+    words: Sequence[str]
+    all_words: int
+    _at_position: Dict[Tuple[int, str], int]
+    _minimum_counts: Dict[Tuple[str, int], int]
+
+    def __init__(self, words: Sequence[str]):
+        self.words = words
+        self.all_words = (1 << len(words)) - 1
+        # Bits are set in byte buffers first, as every OR of a big int would copy the whole bitset.
+        at_position: Dict[Tuple[int, str], bytearray] = {}
+        minimum_counts: Dict[Tuple[str, int], bytearray] = {}
+        bitset_size: int = (len(words) + 7) // 8
+        for i, word in enumerate(words):
+            byte, bit = divmod(i, 8)
+            counts: Dict[str, int] = {}
+            for position, letter in enumerate(word):
+                at_position.setdefault((position, letter), bytearray(bitset_size))[byte] |= 1 << bit
+                counts[letter] = counts.get(letter, 0) + 1
+            for letter, count in counts.items():
+                for minimum_count in range(1, count + 1):
+                    minimum_counts.setdefault((letter, minimum_count), bytearray(bitset_size))[byte] |= 1 << bit
+        self._at_position = {key: int.from_bytes(bits, "little") for key, bits in at_position.items()}
+        self._minimum_counts = {key: int.from_bytes(bits, "little") for key, bits in minimum_counts.items()}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def with_letter_at(self, position: int, letter: str) -> int:
+        return self._at_position.get((position, letter), 0)
+
+    def with_minimum_count(self, letter: str, count: int) -> int:
+        # Every word contains a letter at least zero times.
+        return self._minimum_counts.get((letter, count), 0) if count > 0 else self.all_words
+
+    def query(self, letters_at: Mapping[int, str] | None = None, letters_not_at: Iterable[Tuple[int, str]] = (),
+              minimum_counts: Mapping[str, int] | None = None, absent_letters: Iterable[str] = ()) -> int:
+        """
+        Returns the bitset of the words which have the given letters at the given positions, none of the letters_not_at,
+        at least the given number of copies of the minimum_counts letters and none of the absent letters.
+        """
+        matching: int = self.all_words
+        for position, letter in (letters_at or {}).items():
+            matching &= self.with_letter_at(position, letter)
+        for position, letter in letters_not_at:
+            matching &= ~self.with_letter_at(position, letter)
+        for letter, count in (minimum_counts or {}).items():
+            matching &= self.with_minimum_count(letter, count)
+        for letter in absent_letters:
+            matching &= ~self.with_minimum_count(letter, 1)
+        return matching
+
+    def consistent_with(self, guess: str, feedback: Sequence[Feedback]) -> int:
+        # Words which would score the guess with the same feedback: an absent letter caps the letter's count
+        # at the number of its scored copies.
+        matching: int = self.all_words
+        scored_counts: Dict[str, int] = {}
+        capped_letters: List[str] = []
+        for position, (letter, letter_feedback) in enumerate(zip(guess, feedback)):
+            if letter_feedback == Feedback.CORRECT:
+                matching &= self.with_letter_at(position, letter)
+            else:
+                matching &= ~self.with_letter_at(position, letter)
+            if letter_feedback == Feedback.ABSENT:
+                capped_letters.append(letter)
+            else:
+                scored_counts[letter] = scored_counts.get(letter, 0) + 1
+        for letter, count in scored_counts.items():
+            matching &= self.with_minimum_count(letter, count)
+        for letter in capped_letters:
+            matching &= ~self.with_minimum_count(letter, scored_counts.get(letter, 0) + 1)
+        return matching
+
+    def allowed_by(self, constraints: HardModeConstraints) -> int:
+        return self.query({position: letter for position, letter in enumerate(constraints.correct_letters) if letter},
+                          minimum_counts=constraints.minimum_counts)
+
+    def get_words(self, matching: int) -> List[str]:
+        # Walks over the set bits only, so small results of big dictionaries are cheap.
+        words: List[str] = []
+        while matching:
+            lowest_bit: int = matching & -matching
+            words.append(self.words[lowest_bit.bit_length() - 1])
+            matching ^= lowest_bit
+        return words
+
+    @staticmethod
+    def count(matching: int) -> int:
+        return matching.bit_count()
@@ -0,0 +1,41 @@
+from typing import Dict, List, Sequence, Tuple
+
+from models.feedback import Feedback
+
+
+def score_guess(guess: str, word: str) -> Tuple[Feedback, ...]:
+    """
+    Scores a guess against the drawn word. Both words are expected to be lowercase and of the same length.
+    A letter is correct when it is on the same position, and present only as many times as it occurs in the word
+    on positions which were not guessed correctly, counting from the left.
+    """
+    feedback: List[Feedback] = [Feedback.ABSENT] * len(word)
+    remaining_letters: Dict[str, int] = {}
+    for i, letter in enumerate(word):
+        if guess[i] == letter:
+            feedback[i] = Feedback.CORRECT
+        else:
+            remaining_letters[letter] = remaining_letters.get(letter, 0) + 1
+
+    for i, letter in enumerate(guess):
+        if feedback[i] is not Feedback.CORRECT and remaining_letters.get(letter, 0) > 0:
+            feedback[i] = Feedback.PRESENT
+            remaining_letters[letter] -= 1
+
+    return tuple(feedback)
+
+
+def encode_feedback(feedback: Sequence[Feedback]) -> int:
+    # Base-3 number, where the first letter is the least significant digit.
+    code: int = 0
+    for letter_feedback in reversed(feedback):
+        code = code * 3 + letter_feedback
+    return code
+
+
+def decode_feedback(code: int, length: int) -> Tuple[Feedback, ...]:
+    feedback: List[Feedback] = []
+    for _ in range(length):
+        code, digit = divmod(code, 3)
+        feedback.append(Feedback(digit))
+    return tuple(feedback)
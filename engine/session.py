@@ -0,0 +1,36 @@
+from typing import Tuple
+
+from engine.game_state import GameState
+from models.feedback import Feedback
+from word_index import WordIndex
+
+
+class GameSession:
+    """
+    Class responsible for a single game hosted by the server, with the same rules as the pygame game.
+    The dictionary is shared by all sessions of the same mode and never modified, so a session holds only its own game.
+
+    :param session_id: identifier of the session, unique within the server
+    :type session_id: int
+    :param word_index: dictionary of the session's mode, which guesses are validated against
+    :type word_index: WordIndex
+    :param word: drawn word, which has to be guessed
+    :type word: str
+    :param hard_mode: whether every guess has to use the letters revealed by the previous ones
+    :type hard_mode: bool
+    """
+    __slots__ = ("session_id", "word_index", "game")
+
+    def __init__(self, session_id: int, word_index: WordIndex, word: str, hard_mode: bool = False):
+        self.session_id: int = session_id
+        self.word_index: WordIndex = word_index
+        self.game: GameState = GameState(word, hard_mode=hard_mode)
+
+    def guess(self, word: str) -> Tuple[Feedback, ...]:
+        # Rejected guesses do not count, exactly like in Pyrdle.check_word.
+        if len(word) != len(self.game.word):
+            raise ValueError("Not enough letters!")
+        if word not in self.word_index:
+            raise ValueError("Not in word list!")
+        # Hard mode violations are raised by the game itself.
+        return self.game.submit_guess(word)
@@ -0,0 +1,133 @@
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from engine.batch_scoring import BatchScorer
+from engine.constraints import HardModeConstraints
+from engine.feedback_matrix import FeedbackMatrix
+from engine.scoring import decode_feedback, encode_feedback, score_guess
+from models.feedback import Feedback
+
+HINT_TIME_BUDGET: float = 0.016  # One frame at 60 FPS.
+ENTROPY_SAMPLE_SIZE: int = 256  # Entropy of large candidate sets is estimated on an evenly spread sample.
+BLOCK_PAIRS: int = 1 << 14  # Number of (guess, candidate) pairs evaluated between deadline checks.
+
+
+class EntropySolver:
+    """
+    Class responsible for suggesting the guess which is expected to reveal the most about the drawn word.
+    Words which can still be the drawn one are narrowed down after every scored guess.
+
+    :param matrix: feedback of every guess against every word of the dictionary
+    :type matrix: FeedbackMatrix
+    :param hard_mode: whether suggested guesses have to use the letters revealed by the previous ones
+    :type hard_mode: bool
+    """
+    matrix: FeedbackMatrix
+    candidates: np.ndarray
+    constraints: HardModeConstraints | None
+
+    def __init__(self, matrix: FeedbackMatrix, hard_mode: bool = False):
+        self.matrix = matrix
+        self.hard_mode: bool = hard_mode
+        self._codes: np.ndarray = np.asarray(matrix.codes)
+        self._scorer: BatchScorer = BatchScorer(matrix.words)
+        # Which letters every word contains, used to try the most promising guesses first.
+        self._letter_presence: np.ndarray = (self._scorer.letter_counts > 0).astype(np.float32)
+        self.reset()
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    @property
+    def remaining_words(self) -> List[str]:
+        return [self.matrix.words[index] for index in self.candidates]
+
+    def reset(self) -> None:
+        self.candidates = np.arange(len(self.matrix))
+        self._is_candidate: np.ndarray = np.ones(len(self.matrix), dtype=bool)
+        self.constraints = HardModeConstraints(self._scorer.length) if self.hard_mode else None
+        self._is_allowed: np.ndarray = np.ones(len(self.matrix), dtype=bool)  # Guesses allowed by the hard mode.
+
+    def update(self, guess: str, feedback_code: int) -> None:
+        # Only the words which were still possible are checked against the new feedback.
+        guess = guess.lower()
+        if guess in self.matrix:
+            candidate_codes: np.ndarray = self._codes[self.matrix.index_of(guess), self.candidates]
+        else:
+            candidate_codes = np.array([encode_feedback(score_guess(guess, self.matrix.words[index])) for index in self.candidates])
+        is_consistent: np.ndarray = candidate_codes == feedback_code
+        self._is_candidate[self.candidates[~is_consistent]] = False
+        self.candidates = self.candidates[is_consistent]
+        if self.constraints is not None:
+            self._update_allowed_guesses(guess, decode_feedback(feedback_code, self._scorer.length))
+
+    def _update_allowed_guesses(self, guess: str, feedback: Tuple[Feedback, ...]) -> None:
+        # Constraints only get stricter, so only what the new guess revealed has to be applied to the allowed words.
+        self.constraints.update(guess, feedback)
+        encoded_guess: np.ndarray = self._scorer.encode([guess])[0]
+        revealed_counts: Dict[int, int] = {}
+        for i, letter_feedback in enumerate(feedback):
+            if letter_feedback == Feedback.CORRECT:
+                self._is_allowed &= self._scorer.encoded_words[:, i] == encoded_guess[i]
+            if letter_feedback != Feedback.ABSENT:
+                revealed_counts[encoded_guess[i]] = revealed_counts.get(encoded_guess[i], 0) + 1
+        for letter_code, count in revealed_counts.items():
+            self._is_allowed &= self._scorer.letter_counts[letter_code] >= count
+
+    def suggest(self, time_budget: float = HINT_TIME_BUDGET, guess_budget: int | None = None) -> str | None:
+        """
+        Returns the best guess found within the time budget. Guesses are evaluated in the order of a cheap letter
+        coverage estimate, so the most promising ones are considered even when the budget runs out.
+        When a guess budget is given, exactly that many guesses are evaluated instead, whatever the time it takes,
+        so the suggestion does not depend on the speed of the machine.
+        """
+        deadline: float = time.perf_counter() + time_budget
+        if len(self.candidates) == 0:
+            return None
+        if len(self.candidates) <= 2:
+            return self.matrix.words[self.candidates[0]]
+
+        sample: np.ndarray = self.candidates[::-(-len(self.candidates) // ENTROPY_SAMPLE_SIZE)]
+        guesses_order: np.ndarray = self._get_guesses_order()
+        if self.constraints is not None:
+            guesses_order = guesses_order[self._is_allowed[guesses_order]]
+        if guess_budget is not None:
+            guesses_order = guesses_order[:guess_budget]
+        block_size: int = max(1, BLOCK_PAIRS // len(sample))
+        best_guess: int = guesses_order[0]
+        best_score: float = -1
+        block_start_time: float = time.perf_counter()
+        for start in range(0, len(guesses_order), block_size):
+            guesses: np.ndarray = guesses_order[start:start + block_size]
+            # Possible words can win right away, which breaks ties in their favour.
+            scores: np.ndarray = self._get_entropy(guesses, sample) + self._is_candidate[guesses] / len(self.candidates)
+            best_in_block: int = int(np.argmax(scores))
+            if scores[best_in_block] > best_score:
+                best_guess, best_score = guesses[best_in_block], scores[best_in_block]
+            # Stop when evaluating another block would most likely exceed the budget.
+            block_end_time: float = time.perf_counter()
+            if guess_budget is None and 2 * block_end_time - block_start_time >= deadline:
+                break
+            block_start_time = block_end_time
+        return self.matrix.words[best_guess]
+
+    def _get_guesses_order(self) -> np.ndarray:
+        # Letters which occur in about half of the candidates split them best.
+        letter_frequency: np.ndarray = self._letter_presence[:, self.candidates].sum(axis=1)
+        letter_value: np.ndarray = letter_frequency * (len(self.candidates) - letter_frequency)
+        return np.argsort(-(letter_value @ self._letter_presence), kind="stable")
+
+    def _get_entropy(self, guesses: np.ndarray, sample: np.ndarray) -> np.ndarray:
+        # Sorting groups equal feedback codes of a guess into runs, and every word in a run of length n adds log(n).
+        codes: np.ndarray = np.sort(self._codes[np.ix_(guesses, sample)], axis=1)
+        positions: np.ndarray = np.broadcast_to(np.arange(len(sample)), codes.shape)
+        run_starts: np.ndarray = np.ones(codes.shape, dtype=bool)
+        run_starts[:, 1:] = codes[:, 1:] != codes[:, :-1]
+        run_ends: np.ndarray = np.ones(codes.shape, dtype=bool)
+        run_ends[:, :-1] = run_starts[:, 1:]
+        first_in_run: np.ndarray = np.maximum.accumulate(np.where(run_starts, positions, 0), axis=1)
+        last_in_run: np.ndarray = np.minimum.accumulate(np.where(run_ends, positions, len(sample))[:, ::-1], axis=1)[:, ::-1]
+        run_lengths: np.ndarray = last_in_run - first_in_run + 1
+        return np.log2(len(sample)) - np.log2(run_lengths).sum(axis=1) / len(sample)
@@ -0,0 +1,116 @@
+import importlib
+import random
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Type
+
+from engine.feedback_matrix import FeedbackMatrix
+from engine.solver import EntropySolver
+
+# Guesses are evaluated up to a number rather than a time, so the results of a tournament are reproducible.
+TOURNAMENT_GUESS_BUDGET: int = 1024  # About as many as a hint evaluates within its time budget.
+
+
+class Strategy(ABC):
+    """
+    Base class of guessing strategies played by the tournament. A strategy is created once per process,
+    with the keyword arguments returned by prepare, and reset before every game.
+
+    :param words: lowercase words of the played mode, which every guess has to be one of
+    :type words: List[str]
+    :param words_path: path of the word file, next to which precomputed data is stored
+    :type words_path: str
+    :param hard_mode: whether every guess has to use the letters revealed by the previous ones
+    :type hard_mode: bool
+    """
+
+    def __init__(self, words: List[str], words_path: str, hard_mode: bool = False):
+        self.words = words
+        self.words_path = words_path
+        self.hard_mode = hard_mode
+
+    @classmethod
+    def prepare(cls, words: List[str], words_path: str, hard_mode: bool = False) -> Dict[str, Any]:
+        # Called once per tournament, so the work shared by every process is not repeated by each of them.
+        return {}
+
+    def reset(self) -> None:
+        pass
+
+    @abstractmethod
+    def next_guess(self) -> str:
+        pass
+
+    def update(self, guess: str, feedback_code: int) -> None:
+        pass
+
+
+class RandomStrategy(Strategy):
+    """
+    Guesses a random word among the ones which are still possible, which are always allowed by the hard mode too
+    """
+
+    def __init__(self, words: List[str], words_path: str, hard_mode: bool = False):
+        super().__init__(words, words_path, hard_mode)
+        self.rng: random.Random = random.Random(0)
+        # Only the solver's narrowing down of the possible words is used.
+        self.solver: EntropySolver = EntropySolver(FeedbackMatrix.load_or_build(words_path, words))
+
+    def reset(self) -> None:
+        self.solver.reset()
+
+    def next_guess(self) -> str:
+        return self.words[self.rng.choice(self.solver.candidates)]
+
+    def update(self, guess: str, feedback_code: int) -> None:
+        self.solver.update(guess, feedback_code)
+
+
+class EntropyStrategy(Strategy):
+    """
+    Guesses what the hint does (see engine.solver.EntropySolver), with a fixed number of evaluated guesses instead of
+    the hint's time budget. The first guess is the same in every game, so it is searched for among all the words only once.
+
+    :param first_guess: guess opening every game, searched for when not given
+    :type first_guess: str | None
+    """
+
+    def __init__(self, words: List[str], words_path: str, hard_mode: bool = False, first_guess: str | None = None):
+        super().__init__(words, words_path, hard_mode)
+        self.solver: EntropySolver = EntropySolver(FeedbackMatrix.load_or_build(words_path, words), hard_mode)
+        self.first_guess: str = first_guess if first_guess is not None else self.find_first_guess(self.solver)
+
+    @classmethod
+    def prepare(cls, words: List[str], words_path: str, hard_mode: bool = False) -> Dict[str, Any]:
+        return {"first_guess": cls.find_first_guess(EntropySolver(FeedbackMatrix.load_or_build(words_path, words), hard_mode))}
+
+    @staticmethod
+    def find_first_guess(solver: EntropySolver) -> str:
+        return solver.suggest(guess_budget=len(solver.matrix))
+
+    def reset(self) -> None:
+        self.solver.reset()
+
+    def next_guess(self) -> str:
+        if len(self.solver) == len(self.words):
+            return self.first_guess
+        return self.solver.suggest(guess_budget=TOURNAMENT_GUESS_BUDGET)
+
+    def update(self, guess: str, feedback_code: int) -> None:
+        self.solver.update(guess, feedback_code)
+
+
+STRATEGIES: Dict[str, Type[Strategy]] = {
+    "random": RandomStrategy,
+    "entropy": EntropyStrategy
+}
+
+
+def get_strategy(name: str) -> Type[Strategy]:
+    # Besides the built-in names, any Strategy subclass can be given as "module:ClassName".
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    module_name, _, class_name = name.partition(":")
+    strategy: Type[Strategy] = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(strategy, type) and issubclass(strategy, Strategy)):
+        raise ValueError(f"{name} is not a Strategy")
+    return strategy
@@ -0,0 +1,98 @@
+import time
+import unicodedata
+from typing import Dict, List, Sequence, Set, Tuple
+
+MAX_DISTANCE: int = 2
+SUGGESTION_TIME_BUDGET: float = 0.004  # Seconds, so the suggestions are shown in the same frame as the rejection.
+# Letters which are not a base letter with a combining mark, so they do not lose the mark by the normalization.
+UNDECOMPOSED_LETTERS: Dict[str, str] = {"ł": "l"}
+
+
+def get_folding_table(letters: str) -> Dict[int, str]:
+    # Maps every language specific letter to its base letter, i.e. "Ż" and "ż" to "z", so a guess typed without
+    # diacritics still finds the words with them.
+    table: Dict[int, str] = {}
+    for letter in letters.lower():
+        base_letter: str = UNDECOMPOSED_LETTERS.get(letter, unicodedata.normalize("NFD", letter)[0])
+        if base_letter != letter:
+            table[ord(letter)] = base_letter
+    return table
+
+
+def get_deletions(word: str, max_distance: int) -> List[Set[str]]:
+    # Strings left after deleting every combination of letters, grouped by the number of deleted letters.
+    deletions: List[Set[str]] = [{word}]
+    for _ in range(min(max_distance, len(word))):
+        deletions.append({string[:i] + string[i + 1:] for string in deletions[-1] for i in range(len(string))})
+    return deletions
+
+
+def edit_distance(first: str, second: str) -> int:
+    # Levenshtein distance where swapping two adjacent letters counts as a single edit, as it is a common typo.
+    previous_row: List[int] = list(range(len(second) + 1))
+    row_before_previous: List[int] = previous_row
+    for i in range(1, len(first) + 1):
+        row: List[int] = [i] + [0] * len(second)
+        for j in range(1, len(second) + 1):
+            cost: int = first[i - 1] != second[j - 1]
+            row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                row[j] = min(row[j], row_before_previous[j - 2] + 1)
+        row_before_previous, previous_row = previous_row, row
+    return previous_row[-1]
+
+
+class SuggestionIndex:
+    """
+    Class responsible for finding the words closest to a rejected guess. Every word is indexed under all the strings
+    which remain after deleting up to max_distance of its letters, and two words within max_distance edits share
+    at least one of them, so only the words sharing a deletion with the guess have their distance computed.
+    Words and guesses are compared with the language specific letters folded to their base letters.
+
+    :param words: lowercase words which can be suggested
+    :type words: Sequence[str]
+    :param language_specific_letters: letters folded to their base letters when comparing words
+    :type language_specific_letters: str
+    :param max_distance: maximum number of edits between a guess and a suggested word
+    :type max_distance: int
+    """
+    words: Sequence[str]
+    _deletions: Dict[str, List[int]]
+
+    def __init__(self, words: Sequence[str], language_specific_letters: str = "", max_distance: int = MAX_DISTANCE):
+        self.words = words
+        self.max_distance = max_distance
+        self._folding_table: Dict[int, str] = get_folding_table(language_specific_letters)
+        self._folded_words: List[str] = [word.translate(self._folding_table) for word in words]
+        self._deletions = {}
+        for index, folded_word in enumerate(self._folded_words):
+            for deletions in get_deletions(folded_word, max_distance):
+                for deletion in deletions:
+                    self._deletions.setdefault(deletion, []).append(index)
+
+    def suggest(self, guess: str, limit: int = 3, time_budget: float = SUGGESTION_TIME_BUDGET) -> List[str]:
+        """
+        Returns up to limit words closest to the guess, the closest first. Once the time budget is spent,
+        only the words found so far are considered.
+        """
+        deadline: float = time.perf_counter() + time_budget
+        folded_guess: str = guess.lower().translate(self._folding_table)
+        distances: Dict[int, int] = {}
+        # Fewer deleted letters come first, as they lead to the closer words, which are then found within the budget.
+        for deleted_letters, deletions in enumerate(get_deletions(folded_guess, self.max_distance)):
+            for deletion in deletions:
+                for index in self._deletions.get(deletion, ()):
+                    if index not in distances:
+                        distances[index] = edit_distance(folded_guess, self._folded_words[index])
+                        if time.perf_counter() > deadline:
+                            return self._get_closest(distances, limit)
+            # Words of the guess' length differing by n substituted letters share a string with n letters deleted,
+            # so more deletions are only needed while there are not enough of them.
+            if sum(distance <= deleted_letters for distance in distances.values()) >= limit:
+                break
+        return self._get_closest(distances, limit)
+
+    def _get_closest(self, distances: Dict[int, int], limit: int) -> List[str]:
+        # Words differing only by diacritics are at no distance, so they come first.
+        closest: List[Tuple[int, int]] = sorted((distance, index) for index, distance in distances.items() if distance <= self.max_distance)
+        return [self.words[index] for _, index in closest[:limit]]
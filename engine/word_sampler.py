@@ -0,0 +1,150 @@
+import csv
+import json
+import math
+import os
+import random
+from typing import Dict, List, Sequence, Tuple
+
+from models.sampling_mode import SamplingMode
+
+SAMPLER_STATE_EXTENSION: str = ".sampler"
+
+
+class AliasTable:
+    """
+    Class responsible for drawing indexes with the given weights in constant time (Vose's alias method).
+    Every index gets a column, filled up to the average weight with the rest of an overweight index.
+
+    :param weights: non-negative weight of every index, not all zero
+    :type weights: Sequence[float]
+    """
+    probabilities: List[float]
+    aliases: List[int]
+
+    def __init__(self, weights: Sequence[float]):
+        count: int = len(weights)
+        total: float = sum(weights)
+        if not total > 0:
+            raise ValueError("Weights must sum up to a positive number")
+        scaled: List[float] = [weight * count / total for weight in weights]
+        self.probabilities = [1.0] * count
+        self.aliases = list(range(count))
+        small: List[int] = [index for index, weight in enumerate(scaled) if weight < 1]
+        large: List[int] = [index for index, weight in enumerate(scaled) if weight >= 1]
+        while small and large:
+            index, alias = small.pop(), large[-1]
+            self.probabilities[index] = scaled[index]
+            self.aliases[index] = alias
+            scaled[alias] -= 1 - scaled[index]
+            if scaled[alias] < 1:
+                small.append(large.pop())
+        # Whatever is left is full up to rounding errors.
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
+    def draw(self, rng: random.Random) -> int:
+        index: int = int(rng.random() * len(self.probabilities))
+        return index if rng.random() < self.probabilities[index] else self.aliases[index]
+
+
+class WordSampler:
+    """
+    Class responsible for drawing the words to guess of a single mode. In the shuffle bag mode, every word is drawn once
+    in a random order before any is drawn again. In the weighted mode, words are drawn with their frequencies.
+    The whole state is the seed and the number of draws so far, so a sampler can be stored, restored and replayed.
+
+    :param words: words which can be drawn
+    :type words: Sequence[str]
+    :param mode: how the words are drawn
+    :type mode: SamplingMode(str, Enum)
+    :param seed: seed of the drawing order
+    :type seed: int
+    :param draws: number of words drawn so far
+    :type draws: int
+    :param weights: weight of every word in the weighted mode, equal when not given or all zero
+    :type weights: Sequence[float] | None
+    :param state_path: file storing the state after every draw, if any
+    :type state_path: str | None
+    """
+    words: Sequence[str]
+    mode: SamplingMode
+    seed: int
+    draws: int
+
+    def __init__(self, words: Sequence[str], mode: SamplingMode = SamplingMode.SHUFFLE_BAG, seed: int = 0, draws: int = 0,
+                 weights: Sequence[float] | None = None, state_path: str | None = None):
+        self.words = words
+        self.mode = mode
+        self.seed = seed
+        self.draws = draws
+        self.state_path = state_path
+        if not weights or not sum(weights) > 0:
+            weights = [1.0] * len(words)
+        self._alias_table: AliasTable | None = AliasTable(weights) if mode == SamplingMode.WEIGHTED else None
+        self._bag: List[int] = []
+        self._bag_number: int = -1
+
+    @property
+    def state(self) -> Tuple[int, int]:
+        return self.seed, self.draws
+
+    def draw(self) -> str:
+        # Every draw has its own generator, derived from the state, so drawing does not depend on the previous draws.
+        # Generators are seeded with strings, which are hashed the same way by every Python version.
+        if self._alias_table is not None:
+            index: int = self._alias_table.draw(random.Random(f"{self.seed}:{self.draws}"))
+        else:
+            bag_number, position = divmod(self.draws, len(self.words))
+            if bag_number != self._bag_number:
+                self._bag = list(range(len(self.words)))
+                random.Random(f"{self.seed}:{bag_number}").shuffle(self._bag)
+                self._bag_number = bag_number
+            index = self._bag[position]
+        self.draws += 1
+        if self.state_path is not None:
+            self.save_state(self.state_path, self.state)
+        return self.words[index]
+
+    @staticmethod
+    def get_state_path(source_path: str) -> str:
+        return os.path.splitext(source_path)[0] + SAMPLER_STATE_EXTENSION
+
+    @staticmethod
+    def load_state(state_path: str) -> Tuple[int, int]:
+        # A missing or damaged state starts a new order.
+        try:
+            with open(state_path, encoding="utf8") as file:
+                state: Dict[str, int] = json.load(file)
+            return int(state["seed"]), int(state["draws"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return random.randrange(2 ** 32), 0
+
+    @staticmethod
+    def save_state(state_path: str, state: Tuple[int, int]) -> None:
+        # Written under a temporary name first, so an interrupted write never loses the state.
+        temporary_path: str = state_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf8") as file:
+            json.dump({"seed": state[0], "draws": state[1]}, file)
+        os.replace(temporary_path, state_path)
+
+
+def read_frequencies(source_path: str) -> Dict[str, float]:
+    """
+    Reads the optional frequencies of a word file: a second row with the frequency of the word in the same column.
+    Returns an empty dictionary when the file has no frequencies. Frequencies which are not a non-negative number
+    are skipped, so their words are drawn with the default weight.
+    """
+    with open(source_path, encoding="utf8") as file:
+        reader = csv.reader(file)
+        words: List[str] = next(reader, [])
+        frequencies: List[str] = next(reader, [])
+    parsed_frequencies: Dict[str, float] = {}
+    for word, frequency in zip(words, frequencies):
+        try:
+            value: float = float(frequency)
+        except ValueError:
+            continue
+        if word.strip() and math.isfinite(value) and value >= 0:
+            parsed_frequencies[word.strip().lower()] = value
+    return parsed_frequencies
@@ -1,8 +1,8 @@
-import csv
 import json
 import os
-from typing import Dict, List
+from typing import Any, Dict, List
 
+from compiled_word_list import CompiledWordList, load_compiled_word_list
 from models.difficulty import Difficulty
 from models.settings import Settings
 
@@ -16,21 +16,45 @@ class FileReader:
     """
     alphabet: str = "QWERTYUIOPASDFGHJKLZXCVBNM"
     language_specific_letters: str
+    # Shared by all instances for the lifetime of the process.
+    _config: Dict[str, Any] | None = None
+    _word_lists: Dict[str, CompiledWordList] = {}
 
     def __init__(self, language: str):
         self.path = f"resources/{language}/"
-        with open("config.json", encoding="utf8") as file:
-            json_object = json.load(file)
-            self.settings = Settings(**json_object[language])
+        self.settings = Settings.from_config(self.get_config()[language])
 
         self.alphabet += self.settings.language_specific_letters
         self.language_specific_letters = self.settings.language_specific_letters
 
-    def get_words(self, chosen_mode: Difficulty) -> List[str]:
+    @classmethod
+    def get_config(cls) -> Dict[str, Any]:
+        if cls._config is None:
+            with open("config.json", encoding="utf8") as file:
+                cls._config = json.load(file)
+        return cls._config
+
+    @classmethod
+    def get_languages(cls) -> List[str]:
+        return list(cls.get_config())
+
+    @classmethod
+    def clear_word_lists(cls) -> None:
+        # Lists still in use stay open, and are closed once the last reference to them is gone.
+        cls._word_lists.clear()
+
+    def get_words_path(self, chosen_mode: Difficulty) -> str:
         paths: Dict[str, str] = {
             Difficulty.EASY: self.settings.easy_mode_filename,
             Difficulty.MEDIUM: self.settings.medium_mode_filename,
             Difficulty.HARD: self.settings.hard_mode_filename
         }
 
-        return next(csv.reader(open(os.path.join(self.path, paths[chosen_mode]), encoding="utf8")))
+        return os.path.join(self.path, paths[chosen_mode])
+
+    def get_words(self, chosen_mode: Difficulty) -> CompiledWordList:
+        # Word files are compiled on the first read and memory-mapped, then kept for every later mode switch.
+        words_path: str = self.get_words_path(chosen_mode)
+        if words_path not in self._word_lists:
+            self._word_lists[words_path] = load_compiled_word_list(words_path)
+        return self._word_lists[words_path]
@@ -0,0 +1,76 @@
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from engine.game_state import GameState, LETTERS_BY_DIFFICULTY
+from engine.pattern_index import PatternIndex
+from file_reader import FileReader
+from models.difficulty import Difficulty
+from models.game_result import GameResult
+from word_index import WordIndex
+
+
+MAX_DRAWS: int = 20  # Random draws of a hard mode guess, before the allowed words are looked up.
+
+
+def play_scripted_game(word: str, words: List[str], rng: random.Random, pattern_index: PatternIndex | None = None) -> GameState:
+    # The scripted player guesses random words from the dictionary until the game is decided.
+    # The hard mode is played when the pattern index of the words is given.
+    game = GameState(word, hard_mode=pattern_index is not None)
+    while not game.is_over:
+        guess: str = rng.choice(words)
+        if pattern_index is not None and not game.constraints.allows(guess):
+            for _ in range(MAX_DRAWS):
+                guess = rng.choice(words)
+                if game.constraints.allows(guess):
+                    break
+            else:
+                guess = rng.choice(pattern_index.get_words(pattern_index.allowed_by(game.constraints)))
+        game.submit_guess(guess)
+    return game
+
+
+def run_games(language: str, difficulty: Difficulty, games: int, seed: int | None = None, hard_mode: bool = False) -> Dict[str, float]:
+    """
+    Plays scripted games without opening a window and returns their statistics.
+    """
+    word_index = WordIndex(FileReader(language).get_words(difficulty))
+    words: List[str] = word_index.words_of_length(LETTERS_BY_DIFFICULTY[difficulty])
+    rng = random.Random(seed)
+    pattern_index: PatternIndex | None = word_index.pattern_index(LETTERS_BY_DIFFICULTY[difficulty]) if hard_mode else None
+
+    wins: int = 0
+    guesses: int = 0
+    start_time: float = time.perf_counter()
+    for _ in range(games):
+        game: GameState = play_scripted_game(rng.choice(words), words, rng, pattern_index)
+        wins += game.result == GameResult.WIN
+        guesses += game.guesses_count
+    elapsed_time: float = time.perf_counter() - start_time
+
+    return {
+        "games": games,
+        "wins": wins,
+        "average_guesses": guesses / games if games else 0.0,
+        "seconds": elapsed_time,
+        "games_per_second": games / elapsed_time if elapsed_time else 0.0
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Plays Pyrdle games without a window.")
+    parser.add_argument("--language", default="english")
+    parser.add_argument("--difficulty", default=Difficulty.EASY.value, choices=[difficulty.value for difficulty in Difficulty])
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--hard", action="store_true", help="play in the hard mode")
+    arguments = parser.parse_args()
+
+    statistics: Dict[str, float] = run_games(arguments.language, Difficulty(arguments.difficulty), arguments.games, arguments.seed, arguments.hard)
+    for name, value in statistics.items():
+        print(f"{name}: {value:.2f}" if isinstance(value, float) else f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
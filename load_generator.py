@@ -0,0 +1,118 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List
+
+from engine.game_state import LETTERS_BY_DIFFICULTY
+from file_reader import FileReader
+from models.difficulty import Difficulty
+from server import DEFAULT_HOST, DEFAULT_PORT
+from utils.rolling_stats import RollingStats
+from word_index import WordIndex
+
+
+class Connection:
+    """
+    Class responsible for a single client connection, shared by many concurrently played games.
+    The server answers requests in order, so every response resolves the oldest waiting request.
+
+    :param reader: stream of the server's responses
+    :type reader: asyncio.StreamReader
+    :param writer: stream of the requests
+    :type writer: asyncio.StreamWriter
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._waiting: Deque[asyncio.Future] = deque()
+        self._receiver: asyncio.Task = asyncio.create_task(self._receive())
+
+    async def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        response: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._waiting.append(response)
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        return await response
+
+    async def close(self) -> None:
+        self._receiver.cancel()
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    async def _receive(self) -> None:
+        while line := await self.reader.readline():
+            self._waiting.popleft().set_result(json.loads(line))
+
+
+async def play_games(connection: Connection, words: List[str], language: str, difficulty: Difficulty, deadline: float,
+                     rng: random.Random, latency: RollingStats, results: Dict[str, int]) -> None:
+    # Plays one game after another with random dictionary words, until the time is up.
+    while time.perf_counter() < deadline:
+        start_time: float = time.perf_counter()
+        response: Dict[str, Any] = await connection.request({"action": "new", "language": language, "difficulty": difficulty.value})
+        latency.add((time.perf_counter() - start_time) * 1000)
+        session_id: int = response["session"]
+        result: str = "NOT_DECIDED"
+        while result == "NOT_DECIDED":
+            start_time = time.perf_counter()
+            response = await connection.request({"action": "guess", "session": session_id, "word": rng.choice(words)})
+            latency.add((time.perf_counter() - start_time) * 1000)
+            if "error" in response:
+                raise RuntimeError(response["error"])
+            result = response["result"]
+        results[result] = results.get(result, 0) + 1
+
+
+async def run_load(host: str, port: int, connections: int, games: int, seconds: float, language: str, difficulty: Difficulty,
+                   seed: int | None = None) -> Dict[str, float]:
+    """
+    Keeps connections x games concurrent games running on the server for the given time and returns their statistics.
+    """
+    words: List[str] = WordIndex(FileReader(language).get_words(difficulty)).words_of_length(LETTERS_BY_DIFFICULTY[difficulty])
+    rng = random.Random(seed)
+    latency = RollingStats(window=100000)
+    results: Dict[str, int] = {}
+
+    opened: List[Connection] = [Connection(*await asyncio.open_connection(host, port)) for _ in range(connections)]
+    start_time: float = time.perf_counter()
+    deadline: float = start_time + seconds
+    await asyncio.gather(*(play_games(connection, words, language, difficulty, deadline, rng, latency, results)
+                           for connection in opened for _ in range(games)))
+    elapsed_time: float = time.perf_counter() - start_time
+    for connection in opened:
+        await connection.close()
+
+    finished_games: int = sum(results.values())
+    return {
+        "concurrent_games": connections * games,
+        "finished_games": finished_games,
+        "wins": results.get("WIN", 0),
+        "games_per_second": finished_games / elapsed_time,
+        "requests_per_second": latency.count / elapsed_time,
+        **{f"latency_{name}_ms": value for name, value in latency.summary().items() if name != "count"}
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Plays many concurrent games against a running Pyrdle server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--connections", type=int, default=10)
+    parser.add_argument("--games", type=int, default=100, help="concurrent games per connection")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--language", default="english")
+    parser.add_argument("--difficulty", default=Difficulty.EASY.value, choices=[difficulty.value for difficulty in Difficulty])
+    parser.add_argument("--seed", type=int, default=None)
+    arguments = parser.parse_args()
+
+    statistics: Dict[str, float] = asyncio.run(run_load(arguments.host, arguments.port, arguments.connections, arguments.games,
+                                                        arguments.seconds, arguments.language, Difficulty(arguments.difficulty), arguments.seed))
+    for name, value in statistics.items():
+        print(f"{name}: {value:.2f}" if isinstance(value, float) else f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,33 @@
+import argparse
+
+from models.Theme import Theme
+from models.difficulty import Difficulty
+from models.sampling_mode import SamplingMode
 from pyrdle import Pyrdle
+from utils.input_recorder import InputRecording
+
+parser = argparse.ArgumentParser(description="Starts Pyrdle.")
+parser.add_argument("--language", default="english")
+parser.add_argument("--difficulty", default=Difficulty.EASY.value, choices=[difficulty.value for difficulty in Difficulty])
+parser.add_argument("--theme", default=Theme.DARK.value, choices=[theme.value for theme in Theme])
+parser.add_argument("--hard", action="store_true", help="every guess has to use the letters revealed by the previous ones")
+parser.add_argument("--seed", type=int, default=None, help="seed of the drawn words, instead of continuing the previous session's")
+parser.add_argument("--sampling", default=SamplingMode.SHUFFLE_BAG.value, choices=[mode.value for mode in SamplingMode],
+                    help="draw every word once before repeating any, or by the frequencies in the word files")
+parser.add_argument("--record", metavar="PATH", help="record the session's inputs to the given file")
+parser.add_argument("--replay", metavar="PATH", help="play a recorded session again, as fast as possible")
+arguments = parser.parse_args()
 
-pyrdle = Pyrdle()
-pyrdle.play()
+if arguments.replay:
+    recording: InputRecording = InputRecording.load(arguments.replay)
+    pyrdle = Pyrdle(recording.language, recording.difficulty, recording.theme, hard_mode=recording.hard_mode,
+                    sampling_mode=recording.sampling_mode, sampler_states=recording.sampler_states)
+    pyrdle.replay(recording)
+else:
+    pyrdle = Pyrdle(arguments.language, Difficulty(arguments.difficulty), Theme(arguments.theme), arguments.seed, arguments.hard,
+                    SamplingMode(arguments.sampling))
+    if arguments.record:
+        recording = pyrdle.start_recording()
+    pyrdle.play()
+    if arguments.record:
+        recording.save(arguments.record)
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Feedback(int, Enum):
+    ABSENT = 0
+    PRESENT = 1
+    CORRECT = 2
@@ -2,5 +2,8 @@ from enum import Enum
 
 
 class FontsName(str, Enum):
+    GUESSED_LETTER = "GUESSED_LETTER"
     INDICATOR = "INDICATOR"
     CHOOSE_MODE = "CHOOSE_MODE"
+    PLAY_AGAIN = "PLAY_AGAIN"
+    MESSAGE_BOX = "MESSAGE_BOX"
@@ -2,6 +2,7 @@ from UI.letterbox import LetterBox
 
 
 class LetterInWord:
+    __slots__ = ("letter", "index")
     letter: LetterBox
     index: int
 
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SamplingMode(str, Enum):
+    SHUFFLE_BAG = "SHUFFLE_BAG"
+    WEIGHTED = "WEIGHTED"
@@ -1,9 +1,17 @@
-from pydantic import BaseModel
+from dataclasses import dataclass, fields
+from typing import Any, Dict
 
 
-class Settings(BaseModel):
+@dataclass
+class Settings:
     language: str
     easy_mode_filename: str
     medium_mode_filename: str
     hard_mode_filename: str
     language_specific_letters: str
+
+    @classmethod
+    def from_config(cls, values: Dict[str, Any]) -> "Settings":
+        # Unknown keys of the config are ignored, as they were by the pydantic model.
+        names = {field.name for field in fields(cls)}
+        return cls(**{name: value for name, value in values.items() if name in names})
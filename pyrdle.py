@@ -1,26 +1,43 @@
-import collections
-import sys
-import threading
+import os
 import time
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 import pygame
 from pygame.event import Event
 
+from UI.assets import Assets
+from UI.choose_mode_button import ChooseModeButton
+from UI.indicator import Indicator
 from UI.letterbox import LetterBox
 from UI.ui import Ui
 from configuration import Configuration
 from constants import Constants
+from engine.game_state import GameState
+from engine.scoring import encode_feedback
+from engine.solver import EntropySolver
 from models.Theme import Theme
 from models.color import Color
 from models.difficulty import Difficulty
+from models.feedback import Feedback
 from models.game_result import GameResult
 from models.letter_in_word import LetterInWord
+from models.sampling_mode import SamplingMode
 from utils.anim_triggerers import flip_anim_triggerer, shake_anim_triggerer
+from utils.input_latency import InputLatencyTracker
+from utils.input_recorder import InputRecorder, InputRecording
+from utils.profiler import DEFAULT_TRACE_PATH, FRAME_SECTION, PROFILER_VARIABLE, TRACE_PATH_VARIABLE, Profiler
+from utils.scheduler import Scheduler
+from utils.startup_timer import StartupTimer
 
-SWOOSH_SFX = pygame.mixer.Sound("resources/sounds/letter_swoosh.ogg")
 AMBIENCE_OST = "resources/sounds/ambience.ogg"
 LETTERBOX_ANIM_FREQ = 250
+POPUP_DISPLAY_TIME = 1000
+FPS = 60
+MAX_FRAME_TIME = 1000 / FPS  # Animations never advance by more than one frame at once, e.g. right after idling.
+IDLE_TIMEOUT = 1000  # Longest time the loop sleeps while waiting for events, in milliseconds.
+STARTUP_REPORT_VARIABLE = "PYRDLE_STARTUP_REPORT"  # When set, the startup timings are printed after the first frame.
+INPUT_LATENCY_SECTION = "input latency"  # Reported on exit with the profiler's measurements.
+UNLOCKED_KEYS = (pygame.K_TAB, pygame.K_F3)  # Keys which do not edit the guess, so they work during animations too.
 
 
 class Pyrdle:
@@ -31,90 +48,122 @@ class Pyrdle:
     :type chosen_language: str
     :param chosen_difficulty: difficulty as a number of letter in words
     :type chosen_difficulty: Difficulty(str, Enum)
+    :param seed: seed of the drawn words, which continue from the previous session when not given
+    :type seed: int | None
+    :param hard_mode: whether every guess has to use the letters revealed by the previous ones
+    :type hard_mode: bool
+    :param sampling_mode: how the words are drawn
+    :type sampling_mode: SamplingMode(str, Enum)
+    :param sampler_states: seed and number of draws of every mode's word sampler, i.e. of a recorded session
+    :type sampler_states: Dict[Difficulty, Tuple[int, int]] | None
     """
     configuration: Configuration
     theme: Theme
     running: bool
-    guesses: List[List[LetterBox]]
     current_guess: List[LetterBox]
-    guesses_count: int
-    current_guess_string: str
-    game_result: GameResult
+    game: GameState
     is_showing_results: bool
 
-    def __init__(self, chosen_language: str = "english", chosen_difficulty: Difficulty = Difficulty.EASY, theme: Theme = Theme.DARK):
-        self.configuration = Configuration(chosen_language, chosen_difficulty, theme)
+    def __init__(self, chosen_language: str = "english", chosen_difficulty: Difficulty = Difficulty.EASY, theme: Theme = Theme.DARK, seed: int | None = None,
+                 hard_mode: bool = False, sampling_mode: SamplingMode = SamplingMode.SHUFFLE_BAG,
+                 sampler_states: Dict[Difficulty, Tuple[int, int]] | None = None):
+        self.startup_timer: Optional[StartupTimer] = StartupTimer()  # Dropped once the first frame is displayed.
+        # The states of the word samplers are always known, so every session can be recorded and played again.
+        self.configuration = Configuration(chosen_language, chosen_difficulty, theme, seed=seed, sampling_mode=sampling_mode,
+                                           sampler_states=sampler_states)
+        self.startup_timer.mark("configuration")
+        self.language = chosen_language
         self.theme = theme
+        self.hard_mode = hard_mode
 
         self.is_locked: bool = False  # Whether the inputs are locked. This happens during animations.
+        self.scheduler: Scheduler = Scheduler()  # Delayed actions, fired from the main loop.
+        self.popup_hide_handle: Optional[int] = None
+        self.solver: Optional[EntropySolver] = None  # Taken from the configuration on the first hint request.
+        self.animating_letters: Dict[LetterBox, None] = {}  # Letterboxes which have to be updated every frame.
+        self.animation_handles: List[int] = []  # Scheduled actions of the current guess' animation.
+        self.input_latency: InputLatencyTracker = InputLatencyTracker()
+        self.recorder: Optional[InputRecorder] = None
+        Profiler.enabled = bool(os.environ.get(PROFILER_VARIABLE))  # Toggled with F3 during the game.
         self.set_default_game_statistic()
         self.configuration.initialize_keyboard()
+        self.configuration.setup_difficulty_buttons()
+        self.startup_timer.mark("keyboard")
 
     def reset(self) -> None:
         Ui.reset_ui()
         self.set_default_game_statistic()
-        Ui.force_display_update()
         for indicator in self.configuration.indicators:
             indicator.reset(self.theme)
+        self.configuration.widgets.invalidate_all()
 
     def set_default_game_statistic(self) -> None:
+        # Stop the animation of the previous game, so it does not draw over the new board.
+        for handle in self.animation_handles:
+            self.scheduler.cancel(handle)
+        self.animation_handles = []
+        self.animating_letters = {}
+        self.is_locked = False
         # Generate new word.
         self.configuration.draw_new_word()
-        # Initialize variables.
-        self.guesses_count = 0
-        self.guesses: List[List[LetterBox]] = [[]]
+        # Initialize variables. Only the letterboxes of the row being typed are kept.
         self.current_guess = []
-        self.current_guess_string = ""
-        self.game_result = GameResult.NOT_DECIDED
+        self.game = GameState(self.configuration.word, hard_mode=self.hard_mode)
         self.is_showing_results = False
+        if self.solver is not None:
+            self.solver.reset()
+
+    @property
+    def game_result(self) -> GameResult:
+        return self.game.result
+
+    @property
+    def guesses_count(self) -> int:
+        return self.game.guesses_count
+
+    @property
+    def current_guess_string(self) -> str:
+        return "".join(letter.character for letter in self.current_guess)
 
     def is_valid_word(self, word: str) -> bool:
-        return word in self.configuration.words
+        return self.configuration.is_valid_word(word)
 
     def create_new_letterbox(self, key_pressed: str) -> None:
-        self.current_guess_string += key_pressed
         new_letterbox = LetterBox(key_pressed, (self.configuration.current_letter_bg_x, self.guesses_count * 100 + Constants.LETTERBOX_X_SPACING - 40), self.theme)
         self.configuration.current_letter_bg_x += Constants.LETTERBOX_X_SPACING
-        if not self.guesses_count + 1 == len(self.guesses):
-            self.guesses.append([])
-        self.guesses[self.guesses_count].append(new_letterbox)
         self.current_guess.append(new_letterbox)
         new_letterbox.draw()
 
     def delete_letterbox(self) -> None:
-        if len(self.current_guess_string) <= 0:
+        if len(self.current_guess) <= 0:
             return
-        self.guesses[self.guesses_count][-1].delete_from_board()
-        self.guesses[self.guesses_count].pop()
-        self.current_guess_string = self.current_guess_string[:-1]
-        self.current_guess.pop()
+        self.current_guess.pop().delete_from_board()
         self.configuration.current_letter_bg_x -= Constants.LETTERBOX_X_SPACING
 
-    @staticmethod
-    def get_frequency_of_letters_in_guessed_word(guess_to_check: List[LetterBox]) -> Dict[str, int]:
-        letters = [x.character for x in guess_to_check]
-        return collections.Counter(letters)
-
-    def get_frequency_of_letters_in_correct_word(self) -> Dict[str, int]:
-        return collections.Counter(self.configuration.word.upper())
+    def delete_letterboxes(self, count: int) -> None:
+        # A batch of backspaces removes its letters at once, with a single move of the cursor.
+        count = min(count, len(self.current_guess))
+        if count <= 0:
+            return
+        for letter in self.current_guess[-count:]:
+            letter.delete_from_board()
+        del self.current_guess[-count:]
+        self.configuration.current_letter_bg_x -= Constants.LETTERBOX_X_SPACING * count
 
     def update_indicator(self, letter: str, color: Color) -> None:
-        for indicator in self.configuration.indicators:
-            if indicator.text == letter and (indicator.bg_color == Color.OUTLINE or indicator.bg_color == Color.OUTLINE_DARK):
-                indicator.bg_color = color
-                indicator.draw()
+        indicator: Indicator = self.configuration.indicators_by_letter[letter]
+        if indicator.bg_color == Color.OUTLINE or indicator.bg_color == Color.OUTLINE_DARK:
+            indicator.bg_color = color
+            self.configuration.widgets.invalidate(indicator)
 
     def update_letter(self, letter: LetterBox, color: Color) -> None:
         self.update_indicator(letter.character, color)
         letter.schedule_params(color, Color.WHITE)
 
         letter.draw()
-        Ui.force_display_update()
 
     def prepare_for_the_next_guess(self) -> None:
-        self.guesses_count += 1
         self.current_guess = []
-        self.current_guess_string = ""
         self.configuration.current_letter_bg_x = self.configuration.starting_offset_for_letter
 
     @staticmethod
@@ -126,47 +175,33 @@ class Pyrdle:
 
     def check_guess(self, guess_word: List[LetterBox]) -> None:
         self.is_locked = True
-        frequency_of_letters_in_correct_word: Dict[str, int] = self.get_frequency_of_letters_in_correct_word()
-        frequency_of_letters_in_guessed_word: Dict[str, int] = self.get_frequency_of_letters_in_guessed_word(guess_word)
+        guess: str = self.current_guess_string
+        feedback: Tuple[Feedback, ...] = self.game.submit_guess(guess)
+        if self.solver is not None:
+            self.solver.update(guess, encode_feedback(feedback))
+        feedback_colors: Dict[Feedback, Color] = {
+            Feedback.CORRECT: Color.GREEN,
+            Feedback.PRESENT: Color.YELLOW,
+            Feedback.ABSENT: Color.GREY if self.theme == Theme.LIGHT else Color.LETTERBOX_DARK_FILL
+        }
         guess_letters: List[LetterInWord] = self.get_letters_with_position(guess_word)
         guess_word_copy: List[LetterBox] = guess_word.copy()
 
-        for guess_letter in guess_letters.copy():
-            if guess_letter.letter.character.lower() == self.configuration.word[guess_letter.index]:
-                self.update_letter(guess_letter.letter, Color.GREEN)
-                self.game_result = GameResult.WIN
+        # Correct letters are revealed first, so the keyboard shows the best known state of each letter.
+        for letter_feedback in (Feedback.CORRECT, Feedback.PRESENT, Feedback.ABSENT):
+            for guess_letter in guess_letters:
+                if feedback[guess_letter.index] == letter_feedback:
+                    self.update_letter(guess_letter.letter, feedback_colors[letter_feedback])
 
-                guess_letters.remove(guess_letter)
-                frequency_of_letters_in_correct_word[guess_letter.letter.character] -= 1
-                frequency_of_letters_in_guessed_word[guess_letter.letter.character] -= 1
-
-        for guess_letter in guess_letters.copy():
-            if guess_letter.letter.character.lower() in self.configuration.word and frequency_of_letters_in_correct_word[guess_letter.letter.character] > 0:
-                self.update_letter(guess_letter.letter, Color.YELLOW)
-                self.game_result = GameResult.NOT_DECIDED
-
-                frequency_of_letters_in_correct_word[guess_letter.letter.character] -= 1
-                frequency_of_letters_in_guessed_word[guess_letter.letter.character] -= 1
-                guess_letters.remove(guess_letter)
-
-        for guess_letter in guess_letters:
-            self.update_letter(guess_letter.letter, Color.GREY if self.theme == Theme.LIGHT else Color.LETTERBOX_DARK_FILL)
-            self.game_result = GameResult.NOT_DECIDED
-
-        if self.guesses_count == 5 and self.game_result == GameResult.NOT_DECIDED:
-            self.game_result = GameResult.LOSE
         self.prepare_for_the_next_guess()
 
         # After all the letters have been processed, prepare their animation.
         for i in range(self.configuration.number_of_letters):
-            thread_kwargs = {'trigger_time': i * LETTERBOX_ANIM_FREQ + 1, 'letterbox': guess_word_copy[i]}
-            t = threading.Thread(target=flip_anim_triggerer, kwargs=thread_kwargs)
-            t.start()
+            self.animation_handles.append(self.scheduler.schedule(i * LETTERBOX_ANIM_FREQ + 1, self.start_flip_animation, guess_word_copy[i]))
 
             # If this is the last letter, create another event which will unlock inputs.
             if i == self.configuration.number_of_letters - 1:
-                t = threading.Thread(target=self.input_unlocker, kwargs={'trigger_time': i * 300 + 300})
-                t.start()
+                self.animation_handles.append(self.scheduler.schedule(i * 300 + 300, self.input_unlocker))
 
     def display_results(self):
         frame_x: float = 10
@@ -184,6 +219,10 @@ class Pyrdle:
     def handle_keyboard_pressed_event(self, event):
         if event.key == pygame.K_RETURN:
             self.check_word()
+        elif event.key == pygame.K_TAB:
+            self.show_hint()
+        elif event.key == pygame.K_F3:
+            self.toggle_profiler()
         elif event.key == pygame.K_BACKSPACE:
             self.delete_letterbox()
         else:
@@ -193,15 +232,19 @@ class Pyrdle:
         if self.is_showing_results:
             self.reset()
         else:
-            key_pressed: str = ""
-            for choose_mode in self.configuration.choose_difficulty_buttons:
-                if choose_mode.is_point_colliding(event.pos):
-                    self.configuration.update_configuration(choose_mode.text)
-                    self.reset()
-                    return
-            for indicator in self.configuration.indicators:
-                if indicator.is_point_colliding(event.pos):
-                    key_pressed = indicator.text
+            widget = self.configuration.widgets.widget_at(event.pos)
+            if isinstance(widget, ChooseModeButton):
+                self.configuration.update_configuration(widget.text)
+                self.configuration.prefetch_suggestion_index()
+                self.configuration.prefetch_solver(self.hard_mode)
+                self.solver = None  # Hints for the previous difficulty are no longer valid.
+                self.reset()
+                return
+            # Like typed keys, the on-screen keyboard is ignored while the inputs are locked.
+            if self.is_locked:
+                self.input_latency.event_dropped()
+                return
+            key_pressed: str = widget.text if isinstance(widget, Indicator) else ""
             if key_pressed == "Enter":
                 self.check_word()
             elif key_pressed == "BckSp":
@@ -213,66 +256,216 @@ class Pyrdle:
         if self.game_result != GameResult.NOT_DECIDED:
             self.reset()
         else:
-            if len(self.current_guess_string) != self.configuration.number_of_letters:
-                Ui.display_popup("Not enough letters!", self.configuration.indicators)
-                self.shake_letters(self.current_guess)
-            elif self.current_guess_string.lower() not in self.configuration.words:
-                Ui.display_popup("Not in word list!", self.configuration.indicators)
+            rejection_reason: str | None = self.get_rejection_reason(self.current_guess_string)
+            if rejection_reason is not None:
+                self.show_popup(rejection_reason)
                 self.shake_letters(self.current_guess)
             else:
                 self.check_guess(self.current_guess)
 
-    @staticmethod
-    def shake_letters(letters) -> None:
+    def get_rejection_reason(self, guess: str) -> str | None:
+        if len(guess) != self.configuration.number_of_letters:
+            return "Not enough letters!"
+        if not self.is_valid_word(guess):
+            return self.get_not_in_word_list_message(guess)
+        return self.game.get_hard_mode_violation(guess)
+
+    def get_not_in_word_list_message(self, guess: str) -> str:
+        suggestions: List[str] = [suggestion.upper() for suggestion in self.configuration.get_suggestions(guess)
+                                  if self.game.get_hard_mode_violation(suggestion) is None]
+        if not suggestions:
+            return "Not in word list!"
+        listed_suggestions: str = suggestions[-1] if len(suggestions) == 1 else f"{', '.join(suggestions[:-1])} or {suggestions[-1]}"
+        return f"Not in word list! Did you mean {listed_suggestions}?"
+
+    def show_popup(self, message: str) -> None:
+        # A newer popup replaces the previous one, so only the latest one schedules hiding.
+        Ui.display_popup(message)
+        self.scheduler.cancel(self.popup_hide_handle)
+        self.popup_hide_handle = self.scheduler.schedule(POPUP_DISPLAY_TIME, self.hide_popup)
+
+    def hide_popup(self) -> None:
+        # The results frame is drawn only once, so it has to be restored if the popup has covered it.
+        if self.is_showing_results:
+            self.display_results()
+            return
+        Ui.hide_popup()
+        for indicator in self.configuration.indicators:
+            self.configuration.widgets.invalidate(indicator)
+
+    def get_solver(self) -> Optional[EntropySolver]:
+        # None while the solver of the mode is still being built in the background.
+        if self.solver is None:
+            solver: Optional[EntropySolver] = self.configuration.solvers.get(self.configuration.chosen_difficulty)
+            if solver is None:
+                return None
+            solver.reset()
+            for guess, feedback in zip(self.game.guesses, self.game.feedback):
+                solver.update(guess, encode_feedback(feedback))
+            self.solver = solver
+        return self.solver
+
+    def show_hint(self) -> None:
+        if self.game_result != GameResult.NOT_DECIDED:
+            return
+        solver: Optional[EntropySolver] = self.get_solver()
+        if solver is None:
+            self.show_popup("Hint is not ready yet!")
+            return
+        hint: str | None = solver.suggest()
+        if hint is None:
+            self.show_popup("No words left!")
+        else:
+            self.show_popup(f"Try {hint.upper()}! ({len(solver)} words left)")
+
+    def shake_letters(self, letters) -> None:
         for letter in letters:
-            t = threading.Thread(target=shake_anim_triggerer, kwargs={'letterbox': letter})
-            t.start()
+            shake_anim_triggerer(letter)
+            self.animating_letters[letter] = None
+
+    def start_flip_animation(self, letter: LetterBox) -> None:
+        flip_anim_triggerer(letter)
+        self.animating_letters[letter] = None
 
     def insert_letter(self, key_pressed) -> None:
-        if key_pressed in self.configuration.file_reader.alphabet and key_pressed != "":
-            if len(self.current_guess_string) < self.configuration.number_of_letters:
+        if key_pressed in self.configuration.file_reader.alphabet and key_pressed != "" and not self.game.is_over:
+            if len(self.current_guess) < self.configuration.number_of_letters:
                 self.create_new_letterbox(key_pressed)
+                self.input_latency.letter_inserted()
 
     def check_game_complete(self) -> None:
-        if self.game_result != GameResult.NOT_DECIDED:
+        if self.game_result != GameResult.NOT_DECIDED and not self.is_showing_results:
             self.display_results()
 
-    def handle_events(self) -> None:
-        for event in pygame.event.get():
+    def handle_events(self, events: List[Event]) -> None:
+        # All events received since the last frame are handled, in order.
+        pending_deletions: int = 0
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return
+            if event.type == pygame.KEYDOWN and self.is_locked and event.key not in UNLOCKED_KEYS:
+                self.input_latency.event_dropped()
+                continue
+            # Repeated backspaces are collapsed and applied at once, before the next input which is not a backspace.
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_BACKSPACE:
+                pending_deletions += 1
+                continue
             if event.type == pygame.MOUSEBUTTONDOWN:
+                self.delete_letterboxes(pending_deletions)
+                pending_deletions = 0
                 self.handle_mouse_clicked_event(event)
-                return
-            if event.type == pygame.KEYDOWN and not self.is_locked:
+            elif event.type == pygame.KEYDOWN:
+                self.delete_letterboxes(pending_deletions)
+                pending_deletions = 0
                 self.handle_keyboard_pressed_event(event)
-                return
+        self.delete_letterboxes(pending_deletions)
 
     def update(self, delta_time: float) -> None:
-        for guess in self.guesses:
-            for letter in guess:
-                letter.update(delta_time)
+        for letter in list(self.animating_letters):
+            letter.update(delta_time)
+            if not letter.is_flip_playing and not letter.is_shake_playing:
+                del self.animating_letters[letter]
+
+    def is_idle(self) -> bool:
+        return not self.animating_letters
+
+    def wait_for_events(self, clock: pygame.time.Clock) -> Tuple[int, List[Event]]:
+        # Sleeps until an event arrives or the next scheduled action is due, instead of rendering unchanged frames.
+        timeout: float | None = self.scheduler.time_until_next()
+        first_event: Event = pygame.event.wait(IDLE_TIMEOUT if timeout is None else max(int(timeout), 1))
+        self.input_latency.events_waited_for(time.perf_counter() * 1000)
+        events: List[Event] = [] if first_event.type == pygame.NOEVENT else [first_event]
+        return clock.tick(), events + pygame.event.get()
+
+    def run_frame(self, clock: pygame.time.Clock) -> None:
+        if self.is_idle():
+            elapsed_ms, events = self.wait_for_events(clock)
+        else:
+            elapsed_ms, events = clock.tick(FPS), pygame.event.get()
+            self.input_latency.events_polled(time.perf_counter() * 1000)
+        if self.recorder is not None:
+            self.recorder.record(events)
+        self.advance_frame(elapsed_ms, events)
+
+    def advance_frame(self, elapsed_ms: float, events: List[Event]) -> None:
+        frame_start_time: float = time.perf_counter()
+        with Profiler.measure("scheduler"):
+            self.scheduler.advance(elapsed_ms)
+        with Profiler.measure("handle_events"):
+            self.handle_events(events)
+        with Profiler.measure("update"):
+            self.update(min(elapsed_ms, MAX_FRAME_TIME) / 1000)
+        with Profiler.measure("widgets"):
+            self.configuration.widgets.redraw_dirty()
+        # Drawn after the widgets, so the keyboard updated by the last guess does not cover the results.
+        self.check_game_complete()
+        if Profiler.enabled:
+            Ui.draw_profiler_overlay(Profiler.get_overlay_lines())
+        Ui.flush()
+        if Profiler.enabled:
+            Profiler.record(FRAME_SECTION, (time.perf_counter() - frame_start_time) * 1000)
+            Profiler.next_frame()
+        self.input_latency.frame_displayed(time.perf_counter() * 1000)
+        if self.startup_timer is not None:
+            self.report_startup()
+            # Built once the game is displayed, so they do not delay the first frame.
+            self.configuration.prefetch_suggestion_index()
+            self.configuration.prefetch_solver(self.hard_mode)
+
+    def report_startup(self) -> None:
+        self.startup_timer.mark("first frame")
+        if os.environ.get(STARTUP_REPORT_VARIABLE):
+            print(self.startup_timer.report(Assets.load_times))
+        self.startup_timer = None
 
     def play(self) -> None:
         clock = pygame.time.Clock()
-        fps: int = 60
         self.running = True
-        pygame.mixer.music.load(AMBIENCE_OST)
-        pygame.mixer.music.play(-1)
-        pygame.mixer.music.set_volume(0.7)
+        Assets.play_music(AMBIENCE_OST, 0.7)
 
         while self.running:
-            self.configuration.setup_difficulty_buttons()
-            delta_time: float = clock.tick(fps) / 1000
-            self.check_game_complete()
-            self.handle_events()
-            self.update(delta_time)
-            pygame.display.update()
-
+            self.run_frame(clock)
+        self.quit()
+
+    def replay(self, recording: InputRecording) -> None:
+        """
+        Feeds the recorded events back with a fixed timestep and no waiting, every event in the frame it was received in.
+        Ends once every event is handled and all animations and scheduled actions are over.
+        """
+        self.running = True
+        frame: int = 0
+        next_event: int = 0
+        while self.running:
+            frame_end_ms: float = (frame + 1) * MAX_FRAME_TIME
+            events: List[Event] = []
+            while next_event < len(recording.events) and recording.events[next_event][0] < frame_end_ms:
+                events.append(recording.events[next_event][1])
+                next_event += 1
+            self.advance_frame(MAX_FRAME_TIME, events)
+            frame += 1
+            if next_event == len(recording.events) and self.is_idle() and len(self.scheduler) == 0:
+                self.running = False
+        self.quit()
+
+    def start_recording(self) -> InputRecording:
+        # The samplers' states from before the first word was drawn, so recording has to start with the session.
+        recording = InputRecording(self.language, self.configuration.chosen_difficulty, self.theme, self.configuration.initial_sampler_states,
+                                   self.hard_mode, self.configuration.sampling_mode)
+        self.recorder = InputRecorder(recording)
+        return recording
+
+    def quit(self) -> None:
+        if Profiler.trace:
+            Profiler.dump(os.environ.get(TRACE_PATH_VARIABLE, DEFAULT_TRACE_PATH), {INPUT_LATENCY_SECTION: self.input_latency.summary()})
+            print(f"{INPUT_LATENCY_SECTION} (upper bound): " + ", ".join(f"{name} {value:.1f} ms" if isinstance(value, float) else f"{name} {value}"
+                                                           for name, value in self.input_latency.summary().items()))
         pygame.quit()
-        sys.exit()
 
-    def input_unlocker(self, trigger_time):
-        time.sleep(trigger_time / 1000)
+    def toggle_profiler(self) -> None:
+        Profiler.enabled = not Profiler.enabled
+        if not Profiler.enabled:
+            Ui.hide_profiler_overlay()
+
+    def input_unlocker(self) -> None:
         self.is_locked = False
@@ -0,0 +1,125 @@
+import argparse
+import asyncio
+import itertools
+import json
+import random
+from typing import Any, Dict, Set, Tuple
+
+from engine.game_state import LETTERS_BY_DIFFICULTY
+from engine.scoring import encode_feedback
+from engine.session import GameSession
+from file_reader import FileReader
+from models.difficulty import Difficulty
+from models.feedback import Feedback
+from word_index import WordIndex
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+
+
+class GameServer:
+    """
+    Class responsible for hosting many games at once over TCP, without pygame. Every line sent by a client is a JSON
+    request, answered by exactly one JSON line, in order:
+
+    - {"action": "new", "language": "english", "difficulty": "EASY", "hard_mode": false} starts a game and returns its session id,
+    - {"action": "guess", "session": 1, "word": "crane"} returns the feedback as a list and the base-3 code,
+    - {"action": "close", "session": 1} ends a game early.
+
+    Failed requests are answered with {"error": message}. A connection can play any number of games at once,
+    and all of them are closed with it.
+
+    :param seed: seed of the drawn words, random when not given
+    :type seed: int | None
+    """
+    sessions: Dict[int, GameSession]
+
+    def __init__(self, seed: int | None = None):
+        self.sessions = {}
+        self.rng: random.Random = random.Random(seed)
+        self._session_ids = itertools.count(1)
+        # Every dictionary is read once and shared by all sessions of its mode.
+        self._word_indexes: Dict[Tuple[str, Difficulty], WordIndex] = {}
+
+    def get_word_index(self, language: str, difficulty: Difficulty) -> WordIndex:
+        if (language, difficulty) not in self._word_indexes:
+            if language not in FileReader.get_languages():
+                raise ValueError(f"Unknown language: {language}")
+            self._word_indexes[(language, difficulty)] = WordIndex(FileReader(language).get_words(difficulty))
+        return self._word_indexes[(language, difficulty)]
+
+    def handle_request(self, request: Dict[str, Any], owned_sessions: Set[int]) -> Dict[str, Any]:
+        action: str = request.get("action", "")
+        if action == "new":
+            difficulty = Difficulty(request.get("difficulty", Difficulty.EASY.value))
+            hard_mode = request.get("hard_mode", False)
+            if not isinstance(hard_mode, bool):
+                raise ValueError(f"Invalid hard_mode: {hard_mode!r}")
+            word_index: WordIndex = self.get_word_index(request.get("language", "english"), difficulty)
+            session = GameSession(next(self._session_ids), word_index, word_index.random_word(LETTERS_BY_DIFFICULTY[difficulty], self.rng),
+                                  hard_mode)
+            self.sessions[session.session_id] = session
+            owned_sessions.add(session.session_id)
+            return {"session": session.session_id, "letters": len(session.game.word), "max_guesses": session.game.max_guesses}
+
+        session_id: int = request.get("session", 0)
+        if session_id not in owned_sessions:
+            raise ValueError(f"Unknown session: {session_id}")
+        session: GameSession = self.sessions[session_id]
+        if action == "guess":
+            feedback: Tuple[Feedback, ...] = session.guess(str(request.get("word", "")).lower())
+            response: Dict[str, Any] = {"session": session_id, "feedback": list(feedback), "code": encode_feedback(feedback),
+                                        "result": session.game.result.value, "guesses": session.game.guesses_count}
+            if session.game.is_over:
+                response["word"] = session.game.word
+                self.close_session(session_id, owned_sessions)
+            return response
+        if action == "close":
+            self.close_session(session_id, owned_sessions)
+            return {"session": session_id, "closed": True}
+        raise ValueError(f"Unknown action: {action}")
+
+    def close_session(self, session_id: int, owned_sessions: Set[int]) -> None:
+        owned_sessions.discard(session_id)
+        self.sessions.pop(session_id, None)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        owned_sessions: Set[int] = set()
+        try:
+            while line := await reader.readline():
+                try:
+                    response: Dict[str, Any] = self.handle_request(json.loads(line), owned_sessions)
+                except (ValueError, TypeError, AttributeError) as error:
+                    response = {"error": str(error)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                # Only waits when the client does not keep up with the responses.
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for session_id in list(owned_sessions):
+                self.close_session(session_id, owned_sessions)
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        server: asyncio.Server = await asyncio.start_server(self.handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hosts Pyrdle games over a JSON lines TCP protocol.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, default=None)
+    arguments = parser.parse_args()
+
+    print(f"Serving on {arguments.host}:{arguments.port}")
+    try:
+        asyncio.run(GameServer(arguments.seed).serve(arguments.host, arguments.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import unittest
+from typing import List
+
+from engine.batch_scoring import BatchScorer
+from engine.scoring import encode_feedback, score_guess
+
+# Repeated letters in the guess, the word or both, which is where the scoring rules are the most subtle.
+WORDS: List[str] = ["eerie", "geese", "speed", "abbey", "babes", "kebab", "llama", "allay", "crane", "sassy"]
+
+
+class BatchScorerTest(unittest.TestCase):
+    def test_matches_score_guess(self):
+        scorer = BatchScorer(WORDS)
+        codes = scorer.score_many(WORDS)
+        for i, guess in enumerate(WORDS):
+            for j, word in enumerate(WORDS):
+                with self.subTest(guess=guess, word=word):
+                    self.assertEqual(int(codes[i, j]), encode_feedback(score_guess(guess, word)))
+
+    def test_guess_with_letters_outside_the_words(self):
+        scorer = BatchScorer(WORDS)
+        for guess in ["zzzzz", "eexee"]:
+            codes = scorer.score(guess)
+            for j, word in enumerate(WORDS):
+                with self.subTest(guess=guess, word=word):
+                    self.assertEqual(int(codes[j]), encode_feedback(score_guess(guess, word)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+import os
+import tempfile
+import unittest
+
+from engine.feedback_matrix import FEEDBACK_MATRIX_EXTENSION, FeedbackMatrix
+
+
+class FeedbackMatrixTest(unittest.TestCase):
+    def test_empty_word_list_gives_empty_matrix(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source_path: str = os.path.join(directory, "5-letters-words.csv")
+            matrix: FeedbackMatrix = FeedbackMatrix.load_or_build(source_path, [])
+            self.assertEqual(len(matrix), 0)
+            self.assertEqual(matrix.codes.shape, (0, 0))
+            self.assertFalse(os.path.exists(os.path.splitext(source_path)[0] + FEEDBACK_MATRIX_EXTENSION))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+import unittest
+
+from models.settings import Settings
+
+
+class SettingsTest(unittest.TestCase):
+    def test_unknown_config_keys_are_ignored(self):
+        settings: Settings = Settings.from_config({
+            "language": "english",
+            "language_specific_letters": "",
+            "easy_mode_filename": "5-letters-words.csv",
+            "medium_mode_filename": "6-letters-words.csv",
+            "hard_mode_filename": "7-letters-words.csv",
+            "comment": "not a setting"
+        })
+        self.assertEqual(settings.language, "english")
+        self.assertFalse(hasattr(settings, "comment"))
+
+
+if __name__ == "__main__":
+    unittest.main()
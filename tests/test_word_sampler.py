@@ -0,0 +1,30 @@
+import os
+import tempfile
+import unittest
+
+from engine.word_sampler import AliasTable, WordSampler, read_frequencies
+from models.sampling_mode import SamplingMode
+
+
+class ReadFrequenciesTest(unittest.TestCase):
+    def test_skips_malformed_frequencies(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "5-letters-words.csv")
+            with open(path, "w", encoding="utf8") as file:
+                file.write("crane,slate,trace,adieu,audio\n3.5,often,,-1,nan\n")
+            self.assertEqual(read_frequencies(path), {"crane": 3.5})
+
+
+class WeightedSamplingTest(unittest.TestCase):
+    def test_alias_table_rejects_zero_weights(self):
+        with self.assertRaises(ValueError):
+            AliasTable([0.0, 0.0])
+
+    def test_zero_weights_fall_back_to_uniform_sampling(self):
+        words = ["crane", "slate", "trace"]
+        sampler = WordSampler(words, SamplingMode.WEIGHTED, seed=1, weights=[0.0, 0.0, 0.0])
+        self.assertEqual({sampler.draw() for _ in range(100)}, set(words))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from engine.feedback_matrix import load_feedback_matrix
+from engine.game_state import LETTERS_BY_DIFFICULTY
+from engine.scoring import encode_feedback
+from engine.session import GameSession
+from engine.strategies import STRATEGIES, Strategy, get_strategy
+from file_reader import FileReader
+from models.difficulty import Difficulty
+from models.game_result import GameResult
+from word_index import WordIndex
+
+CHUNK_SIZE: int = 64  # Number of target words sent to a worker at once.
+
+# State of a worker process, set up once by init_worker. The word list is memory-mapped, so its pages are shared.
+_word_index: WordIndex
+_words: List[str]
+_strategy: Strategy
+_hard_mode: bool
+
+
+def init_worker(language: str, difficulty: Difficulty, strategy_name: str, hard_mode: bool, prepared: Dict[str, Any]) -> None:
+    global _word_index, _words, _strategy, _hard_mode
+    file_reader = FileReader(language)
+    _word_index = WordIndex(file_reader.get_words(difficulty))
+    _words = _word_index.words_of_length(LETTERS_BY_DIFFICULTY[difficulty])
+    _strategy = get_strategy(strategy_name)(_words, file_reader.get_words_path(difficulty), hard_mode, **prepared)
+    _hard_mode = hard_mode
+
+
+def play_game(word: str) -> GameSession:
+    # Same rules as Pyrdle.check_word, so a strategy guessing a word outside the dictionary fails loudly.
+    session = GameSession(0, _word_index, word, _hard_mode)
+    _strategy.reset()
+    while not session.game.is_over:
+        guess: str = _strategy.next_guess()
+        _strategy.update(guess, encode_feedback(session.guess(guess)))
+    return session
+
+
+def play_chunk(start: int, end: int) -> Tuple[int, int, int]:
+    # Returns the number of games, guesses and lost games.
+    guesses: int = 0
+    losses: int = 0
+    for word in _words[start:end]:
+        session: GameSession = play_game(word)
+        guesses += session.game.guesses_count
+        losses += session.game.result == GameResult.LOSE
+    return end - start, guesses, losses
+
+
+def run_tournament(language: str, difficulty: Difficulty, strategy_name: str, workers: int, limit: int | None = None,
+                   hard_mode: bool = False) -> Dict[str, float]:
+    """
+    Plays every word of the mode as the target once, spread over a pool of processes, and returns the statistics.
+    """
+    file_reader = FileReader(language)
+    words: List[str] = WordIndex(file_reader.get_words(difficulty)).words_of_length(LETTERS_BY_DIFFICULTY[difficulty])
+    words_count: int = len(words) if limit is None else min(len(words), limit)
+    if strategy_name in STRATEGIES:
+        # The built-in strategies need the feedback matrix, which is built once upfront instead of by every worker at once.
+        load_feedback_matrix(file_reader, difficulty)
+    prepared: Dict[str, Any] = get_strategy(strategy_name).prepare(words, file_reader.get_words_path(difficulty), hard_mode)
+
+    start_time: float = time.perf_counter()
+    games: int = 0
+    guesses: int = 0
+    losses: int = 0
+    chunks: List[int] = list(range(0, words_count, CHUNK_SIZE))
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(language, difficulty, strategy_name, hard_mode, prepared)) as executor:
+        for chunk_games, chunk_guesses, chunk_losses in executor.map(play_chunk, chunks, [min(start + CHUNK_SIZE, words_count) for start in chunks]):
+            games += chunk_games
+            guesses += chunk_guesses
+            losses += chunk_losses
+    elapsed_time: float = time.perf_counter() - start_time
+
+    return {
+        "games": games,
+        "average_guesses": guesses / games if games else 0.0,
+        "failure_rate": losses / games if games else 0.0,
+        "seconds": elapsed_time,
+        "games_per_second": games / elapsed_time if elapsed_time else 0.0
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Plays every word of a mode with the given guessing strategies and compares them.")
+    parser.add_argument("--language", default="english")
+    parser.add_argument("--difficulty", default=Difficulty.EASY.value, choices=[difficulty.value for difficulty in Difficulty])
+    parser.add_argument("--strategy", action="append", help=f"one of {', '.join(STRATEGIES)} or module:ClassName, can be repeated")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--hard", action="store_true", help="play in the hard mode")
+    parser.add_argument("--limit", type=int, default=None, help="play only this many target words")
+    arguments = parser.parse_args()
+
+    for strategy_name in arguments.strategy or list(STRATEGIES):
+        statistics: Dict[str, float] = run_tournament(arguments.language, Difficulty(arguments.difficulty), strategy_name, arguments.workers, arguments.limit,
+                                                         arguments.hard)
+        print(strategy_name)
+        for name, value in statistics.items():
+            print(f"  {name}: {value:.3f}" if isinstance(value, float) else f"  {name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
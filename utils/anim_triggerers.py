@@ -1,13 +1,10 @@
-import time
+from UI.assets import Assets
 
-import pygame
+SWOOSH_SFX_PATH = "resources/sounds/letter_swoosh.ogg"
 
-SWOOSH_SFX = pygame.mixer.Sound("resources/sounds/letter_swoosh.ogg")
 
-
-def flip_anim_triggerer(trigger_time, letterbox):
-    time.sleep(trigger_time/1000)  # time.sleep() requires seconds.
-    pygame.mixer.Sound.play(SWOOSH_SFX)
+def flip_anim_triggerer(letterbox):
+    Assets.play_sound(SWOOSH_SFX_PATH)
     letterbox.start_flip_animation()
 
 
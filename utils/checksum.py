@@ -0,0 +1,11 @@
+import hashlib
+
+CHUNK_SIZE: int = 1 << 16
+
+
+def file_checksum(path: str) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.digest()
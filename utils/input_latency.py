@@ -0,0 +1,44 @@
+from typing import Dict, List
+
+from utils.rolling_stats import RollingStats
+
+
+class InputLatencyTracker:
+    """
+    Class responsible for measuring the time from a typed letter to displaying it on the screen.
+    pygame does not expose the time at which an event was queued, so the reported latency is an upper bound:
+    events waited for arrive when the wait returns, and events polled arrive after the previous poll at the earliest.
+    """
+    latency: RollingStats
+    dropped_events: int
+
+    def __init__(self):
+        self.latency = RollingStats()
+        self.dropped_events = 0  # Inputs ignored, because they arrived while the inputs were locked.
+        self._received_ms: float = 0
+        self._polled_ms: float | None = None
+        self._pending: List[float] = []
+
+    def events_waited_for(self, time_ms: float) -> None:
+        # Waiting returns as soon as the first event arrives.
+        self._received_ms = time_ms
+        self._polled_ms = time_ms
+
+    def events_polled(self, time_ms: float) -> None:
+        # Includes the time the events spent in the queue while the previous frame was drawn or the loop slept.
+        self._received_ms = time_ms if self._polled_ms is None else self._polled_ms
+        self._polled_ms = time_ms
+
+    def letter_inserted(self) -> None:
+        self._pending.append(self._received_ms)
+
+    def event_dropped(self) -> None:
+        self.dropped_events += 1
+
+    def frame_displayed(self, time_ms: float) -> None:
+        for received_ms in self._pending:
+            self.latency.add(time_ms - received_ms)
+        self._pending.clear()
+
+    def summary(self) -> Dict[str, float]:
+        return {**self.latency.summary(), "dropped_events": self.dropped_events}
@@ -0,0 +1,91 @@
+import json
+import time
+from typing import Any, Dict, List, Tuple
+
+import pygame
+from pygame.event import Event
+
+from models.Theme import Theme
+from models.difficulty import Difficulty
+from models.sampling_mode import SamplingMode
+
+# Only the events handled by the game are recorded.
+RECORDED_EVENT_TYPES: Tuple[int, ...] = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.QUIT)
+RECORDED_EVENT_ATTRIBUTES: Tuple[str, ...] = ("key", "unicode", "mod", "scancode", "pos", "button")
+
+
+class InputRecording:
+    """
+    Class responsible for a recorded session: the game setup, the state of the word samplers and every handled event
+    together with the time it was received, in milliseconds since the start of the recording.
+    Saved as JSON lines, the setup first and then one event per line.
+
+    :param language: language of the recorded game
+    :type language: str
+    :param difficulty: difficulty chosen at the start of the recorded game
+    :type difficulty: Difficulty(str, Enum)
+    :param theme: theme of the recorded game
+    :type theme: Theme(str, Enum)
+    :param sampler_states: seed and number of draws of every mode's word sampler at the start of the session
+    :type sampler_states: Dict[Difficulty, Tuple[int, int]]
+    :param hard_mode: whether the recorded game was played in the hard mode
+    :type hard_mode: bool
+    :param sampling_mode: how the words were drawn
+    :type sampling_mode: SamplingMode(str, Enum)
+    """
+    events: List[Tuple[float, Event]]
+
+    def __init__(self, language: str, difficulty: Difficulty, theme: Theme, sampler_states: Dict[Difficulty, Tuple[int, int]],
+                 hard_mode: bool = False, sampling_mode: SamplingMode = SamplingMode.SHUFFLE_BAG):
+        self.language = language
+        self.difficulty = difficulty
+        self.theme = theme
+        self.sampler_states = sampler_states
+        self.hard_mode = hard_mode
+        self.sampling_mode = sampling_mode
+        self.events = []
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf8") as file:
+            file.write(json.dumps({"language": self.language, "difficulty": self.difficulty.value, "theme": self.theme.value,
+                                   "sampler_states": {difficulty.value: list(state) for difficulty, state in self.sampler_states.items()},
+                                   "hard_mode": self.hard_mode, "sampling_mode": self.sampling_mode.value}) + "\n")
+            for time_ms, event in self.events:
+                attributes: Dict[str, Any] = {name: getattr(event, name) for name in RECORDED_EVENT_ATTRIBUTES if hasattr(event, name)}
+                file.write(json.dumps({"time": time_ms, "type": event.type, "attributes": attributes}) + "\n")
+
+    @classmethod
+    def load(cls, path: str) -> "InputRecording":
+        with open(path, encoding="utf8") as file:
+            setup: Dict[str, Any] = json.loads(file.readline())
+            sampler_states: Dict[Difficulty, Tuple[int, int]] = {Difficulty(difficulty): (state[0], state[1])
+                                                                 for difficulty, state in setup["sampler_states"].items()}
+            recording = cls(setup["language"], Difficulty(setup["difficulty"]), Theme(setup["theme"]), sampler_states,
+                            setup.get("hard_mode", False), SamplingMode(setup.get("sampling_mode", SamplingMode.SHUFFLE_BAG.value)))
+            for line in file:
+                entry: Dict[str, Any] = json.loads(line)
+                attributes: Dict[str, Any] = entry["attributes"]
+                if "pos" in attributes:
+                    attributes["pos"] = tuple(attributes["pos"])
+                recording.events.append((entry["time"], Event(entry["type"], attributes)))
+        return recording
+
+
+class InputRecorder:
+    """
+    Class responsible for capturing the events of a running game into a recording
+
+    :param recording: recording to which the events are appended
+    :type recording: InputRecording
+    """
+    recording: InputRecording
+
+    def __init__(self, recording: InputRecording):
+        self.recording = recording
+        self._start_time: float = time.perf_counter()
+
+    def record(self, events: List[Event]) -> None:
+        time_ms: float = (time.perf_counter() - self._start_time) * 1000
+        for event in events:
+            if event.type in RECORDED_EVENT_TYPES:
+                self.recording.events.append((time_ms, event))
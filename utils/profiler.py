@@ -0,0 +1,93 @@
+import csv
+import functools
+import json
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Deque, Dict, Iterator, List, Tuple
+
+from utils.rolling_stats import RollingStats
+
+PROFILER_VARIABLE: str = "PYRDLE_PROFILE"  # When set, the profiler is enabled from the start.
+TRACE_PATH_VARIABLE: str = "PYRDLE_PROFILE_TRACE"  # Where the trace is written on exit, a .csv path selects CSV over JSON.
+DEFAULT_TRACE_PATH: str = "profile_trace.json"
+TRACE_SIZE: int = 100000  # Only the most recent measurements are kept in the trace.
+FRAME_SECTION: str = "frame"
+
+
+class Profiler:
+    """
+    Class responsible for timing sections of the main loop while it is enabled. Every section keeps rolling statistics,
+    and every measurement is recorded in a trace together with the number of the frame it was taken in.
+    When disabled, measuring a section costs a single check.
+    """
+    enabled: bool = False
+    frame: int = 0
+    sections: Dict[str, RollingStats] = {}
+    trace: Deque[Tuple[int, str, float]] = deque(maxlen=TRACE_SIZE)
+
+    @classmethod
+    def measure(cls, section: str) -> ContextManager[None]:
+        return cls._measure(section) if cls.enabled else nullcontext()
+
+    @classmethod
+    @contextmanager
+    def _measure(cls, section: str) -> Iterator[None]:
+        start_time: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.record(section, (time.perf_counter() - start_time) * 1000)
+
+    @classmethod
+    def timed(cls, section: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        # Decorator measuring every call of the function as the given section.
+        def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not cls.enabled:
+                    return function(*args, **kwargs)
+                with cls._measure(section):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def record(cls, section: str, duration_ms: float) -> None:
+        if section not in cls.sections:
+            cls.sections[section] = RollingStats()
+        cls.sections[section].add(duration_ms)
+        cls.trace.append((cls.frame, section, duration_ms))
+
+    @classmethod
+    def next_frame(cls) -> None:
+        cls.frame += 1
+
+    @classmethod
+    def summary(cls) -> Dict[str, Dict[str, float]]:
+        return {section: stats.summary() for section, stats in cls.sections.items()}
+
+    @classmethod
+    def get_overlay_lines(cls) -> List[str]:
+        frame: Dict[str, float] = cls.sections[FRAME_SECTION].summary() if FRAME_SECTION in cls.sections else RollingStats().summary()
+        slowest: List[Tuple[str, RollingStats]] = sorted(((section, stats) for section, stats in cls.sections.items() if section != FRAME_SECTION),
+                                                         key=lambda item: item[1].percentile(95), reverse=True)
+        lines: List[str] = [f"frame p50 {frame['p50']:.1f} p95 {frame['p95']:.1f} p99 {frame['p99']:.1f} ms"]
+        if slowest:
+            section, stats = slowest[0]
+            lines.append(f"{section} p95 {stats.percentile(95):.2f} ms")
+        return lines
+
+    @classmethod
+    def dump(cls, path: str, extra_summary: Dict[str, Dict[str, float]] | None = None) -> None:
+        # The extra summary holds measurements which are not frame sections, and is written only to JSON.
+        with open(path, "w", newline="", encoding="utf8") as file:
+            if path.endswith(".csv"):
+                writer = csv.writer(file)
+                writer.writerow(["frame", "section", "duration_ms"])
+                writer.writerows(cls.trace)
+            else:
+                json.dump({
+                    "summary": {**cls.summary(), **(extra_summary or {})},
+                    "trace": [{"frame": frame, "section": section, "duration_ms": duration} for frame, section, duration in cls.trace]
+                }, file, indent=2)
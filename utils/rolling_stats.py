@@ -0,0 +1,41 @@
+from collections import deque
+from typing import Deque, Dict
+
+DEFAULT_WINDOW: int = 1000
+
+
+class RollingStats:
+    """
+    Class responsible for statistics of the most recent samples of a measurement
+
+    :param window: number of the most recent samples taken into account
+    :type window: int
+    """
+    count: int
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self.count += 1
+
+    def percentile(self, percent: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": sum(self._samples) / len(self._samples) if self._samples else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(self._samples, default=0.0)
+        }
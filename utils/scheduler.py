@@ -0,0 +1,53 @@
+import heapq
+import itertools
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+
+class Scheduler:
+    """
+    Single threaded timer queue driven by the main loop. Callbacks are fired from advance(), in the order of their
+    trigger time, so they can safely touch the game state and the screen.
+    """
+    _now_ms: float
+    _queue: List[Tuple[float, int, Callable[..., Any], Tuple[Any, ...]]]
+    _pending: Set[int]
+
+    def __init__(self):
+        self._now_ms = 0
+        self._queue = []
+        self._pending = set()
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def now_ms(self) -> float:
+        return self._now_ms
+
+    def schedule(self, delay_ms: float, callback: Callable[..., Any], *args: Any) -> int:
+        # The counter keeps callbacks with the same trigger time in the order they were scheduled.
+        handle: int = next(self._counter)
+        heapq.heappush(self._queue, (self._now_ms + delay_ms, handle, callback, args))
+        self._pending.add(handle)
+        return handle
+
+    def cancel(self, handle: Optional[int]) -> None:
+        # Cancelled entries stay in the queue and are skipped once they come up.
+        self._pending.discard(handle)
+
+    def time_until_next(self) -> Optional[float]:
+        while self._queue and self._queue[0][1] not in self._pending:
+            heapq.heappop(self._queue)
+        if not self._queue:
+            return None
+        return max(self._queue[0][0] - self._now_ms, 0)
+
+    def advance(self, elapsed_ms: float) -> None:
+        self._now_ms += elapsed_ms
+        while self._queue and self._queue[0][0] <= self._now_ms:
+            _, handle, callback, args = heapq.heappop(self._queue)
+            if handle not in self._pending:
+                continue
+            self._pending.discard(handle)
+            callback(*args)
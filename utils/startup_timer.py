@@ -0,0 +1,30 @@
+import time
+from typing import Dict, List, Tuple
+
+
+class StartupTimer:
+    """
+    Class responsible for measuring how long every stage of the startup takes, up to the first displayed frame
+    """
+    stages: List[Tuple[str, float]]
+
+    def __init__(self):
+        self.stages = []
+        self._start_time: float = time.perf_counter()
+        self._last_time: float = self._start_time
+
+    def mark(self, stage: str) -> None:
+        # Records the time since the previous mark, in milliseconds.
+        now: float = time.perf_counter()
+        self.stages.append((stage, (now - self._last_time) * 1000))
+        self._last_time = now
+
+    @property
+    def total(self) -> float:
+        return (self._last_time - self._start_time) * 1000
+
+    def report(self, load_times: Dict[str, float]) -> str:
+        lines: List[str] = [f"{stage}: {duration:.1f} ms" for stage, duration in self.stages]
+        lines.append(f"total: {self.total:.1f} ms")
+        lines += [f"  loaded {name}: {duration:.1f} ms" for name, duration in load_times.items()]
+        return "\n".join(lines)
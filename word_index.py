@@ -0,0 +1,73 @@
+import random
+from typing import Dict, Iterable, List, Set
+
+from compiled_word_list import CompiledWordList
+from engine.pattern_index import PatternIndex
+
+
+class WordIndex:
+    """
+    Class responsible for fast lookups in the dictionary of the chosen mode.
+    Words are normalized to lowercase once, when the index is built, so validation is a single hash lookup.
+    Words of a compiled word list are decoded one length at a time, on the first use of the length, so a process playing
+    a single mode holds only that mode's words as Python strings, and the other lengths stay in the shared mapped file.
+
+    :param words: words read from the dictionary file
+    :type words: Iterable[str]
+    """
+    _word_list: CompiledWordList | None
+    _lookups: Dict[int, Set[str]]
+    _buckets: Dict[int, List[str]]
+    _pattern_indexes: Dict[int, PatternIndex]
+
+    def __init__(self, words: Iterable[str]):
+        self._word_list = words if isinstance(words, CompiledWordList) else None
+        self._lookups = {}
+        self._buckets = {}
+        self._pattern_indexes = {}  # Built on the first query of every length.
+        if self._word_list is None:
+            for word in words:
+                self._add_word(word.strip().lower())
+
+    def __contains__(self, word: str) -> bool:
+        normalized_word: str = word.lower()
+        lookup: Set[str] | None = self._lookups.get(len(normalized_word))
+        if lookup is None:
+            self._load_length(len(normalized_word))
+            lookup = self._lookups.get(len(normalized_word), set())
+        return normalized_word in lookup
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @property
+    def words(self) -> List[str]:
+        # Decodes every length, so it is meant for tools rather than the game.
+        lengths: Iterable[int] = self._word_list.word_lengths if self._word_list is not None else list(self._buckets)
+        return [word for length in lengths for word in self.words_of_length(length)]
+
+    def words_of_length(self, length: int) -> List[str]:
+        self._load_length(length)
+        return self._buckets.get(length, [])
+
+    def pattern_index(self, length: int) -> PatternIndex:
+        if length not in self._pattern_indexes:
+            self._pattern_indexes[length] = PatternIndex(self.words_of_length(length))
+        return self._pattern_indexes[length]
+
+    def random_word(self, length: int, rng: random.Random | None = None) -> str:
+        return (rng or random).choice(self.words_of_length(length))
+
+    def _load_length(self, length: int) -> None:
+        if self._word_list is None or length in self._lookups:
+            return
+        self._lookups[length] = set()
+        for word in self._word_list.words_of_length(length):
+            self._add_word(word.lower())
+
+    def _add_word(self, normalized_word: str) -> None:
+        lookup: Set[str] = self._lookups.setdefault(len(normalized_word), set())
+        if normalized_word == "" or normalized_word in lookup:
+            return
+        lookup.add(normalized_word)
+        self._buckets.setdefault(len(normalized_word), []).append(normalized_word)